@@ -1,6 +1,8 @@
 # backend/ai/job_tools.py
 from textwrap import fill
-from typing import List
+from typing import List, Sequence, Tuple
+
+from ai.matcher import compile_matcher
 
 # ---------- Cover letter (existing) ----------
 
@@ -140,10 +142,31 @@ def generate_interview_questions(job_desc: str, seniority: str = "entry") -> Lis
         base.append("Give an example of influencing architecture decisions.")
     return tech + base
 
+def extract_job_keywords(job_desc: str, n: int = 12) -> List[str]:
+    """Keywords answers are scored against (same set the questions are built from)."""
+    return _extract_keywords(job_desc, n)
+
+EXAMPLE_PHRASES = ("for example", "e.g.", "for instance", "i built", "i designed")
+
 def score_answer(question: str, answer: str, job_keywords: List[str]) -> dict:
+    # Keywords and example phrases share one compiled automaton (cached per
+    # keyword set), so the answer is scanned once instead of once per pattern.
+    matcher = compile_matcher((*EXAMPLE_PHRASES, *job_keywords))
+    return _score(answer, job_keywords, matcher.find(answer))
+
+def score_answers(items: Sequence[Tuple[str, str]], job_keywords: List[str], cache: bool = True) -> List[dict]:
+    """
+    Score a whole session of (question, answer) pairs against one keyword set.
+    Pass cache=False for caller-supplied keywords so they don't churn the
+    compiled-matcher cache.
+    """
+    matcher = compile_matcher((*EXAMPLE_PHRASES, *job_keywords), cache=cache)
+    return [_score(answer, job_keywords, matcher.find(answer)) for _, answer in items]
+
+def _score(answer: str, job_keywords: List[str], found: frozenset) -> dict:
     length = len(answer.split())
-    has_examples = any(x in answer.lower() for x in ["for example", "e.g.", "for instance", "i built", "i designed"])
-    keyword_hits = sum(1 for k in job_keywords if k.lower() in answer.lower())
+    has_examples = any(x in found for x in EXAMPLE_PHRASES)
+    keyword_hits = sum(1 for k in job_keywords if k.lower() in found)
 
     score = 0.0
     score += min(4.0, length / 40.0)        # ~160 words hits 4 pts
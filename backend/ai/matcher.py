@@ -0,0 +1,89 @@
+# backend/ai/matcher.py
+"""
+Multi-pattern substring matcher (Aho-Corasick) for answer scoring.
+
+Compiling once per keyword set lets us find every keyword / example phrase
+in an answer with a single left-to-right pass, instead of one `in` scan per
+pattern. Matching is case-insensitive substring matching, same as
+`pattern.lower() in text.lower()`.
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Tuple
+
+
+class Matcher:
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(dict.fromkeys(p.lower() for p in patterns))
+        # The empty string is "in" every text; keep it out of the automaton.
+        self._always: FrozenSet[str] = frozenset(p for p in self.patterns if not p)
+
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[str, ...]] = [()]
+        for pat in self.patterns:
+            if not pat:
+                continue
+            state = 0
+            for ch in pat:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] += (pat,)
+
+        # BFS to fill failure links. Transitions stay as the sparse trie plus
+        # failure links (not a folded DFA), so memory is linear in the total
+        # pattern length whatever the alphabet.
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] += out[fail[nxt]]
+                queue.append(nxt)
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Return the set of patterns occurring in `text` (case-insensitive)."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found = set(self._always)
+        state = 0
+        for ch in text.lower():
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return frozenset(found)
+
+
+# Upper bound on the summed length of a pattern set; the automaton has at
+# most this many states.
+MAX_PATTERN_CHARS = 64_000
+
+
+@lru_cache(maxsize=256)
+def _compile(patterns: Tuple[str, ...]) -> Matcher:
+    return Matcher(patterns)
+
+
+def compile_matcher(patterns: Iterable[str], cache: bool = True) -> Matcher:
+    """
+    Matcher for a pattern set (order and case don't matter). Cached unless
+    `cache` is False — pass that for client-supplied sets so arbitrary
+    requests can't fill the cache.
+    """
+    key = tuple(sorted({p.lower() for p in patterns}))
+    if sum(len(p) for p in key) > MAX_PATTERN_CHARS:
+        raise ValueError(f"Pattern set exceeds {MAX_PATTERN_CHARS} characters")
+    return _compile(key) if cache else Matcher(key)
@@ -0,0 +1,81 @@
+# backend/benchmarks/cold_start.py
+"""
+Cold-start budget check: `import main` + lifespan + first request, measured in
+a fresh interpreter. Exits non-zero when over budget so CI can gate on it.
+
+    cd backend && python -m benchmarks.cold_start [--budget-ms 1500] [--runs 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs inside the child interpreter. TestClient (and the httpx it pulls in) is
+# imported after `import main` so it isn't billed to the app's import time.
+_CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import main
+t_import = time.perf_counter() - t0
+from fastapi.testclient import TestClient
+t1 = time.perf_counter()
+with TestClient(main.app) as client:
+    r = client.get("/applications/")
+    assert r.status_code == 200, r.text
+    t_first = time.perf_counter() - t1
+    startup = client.get("/health/startup").json()
+print(json.dumps({"import_ms": t_import * 1000, "first_request_ms": t_first * 1000, "startup": startup}))
+"""
+
+
+def measure_once() -> dict:
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR)
+    with tempfile.TemporaryDirectory() as tmp:  # fresh data.db each run
+        out = subprocess.run(
+            [sys.executable, "-c", _CHILD], cwd=tmp, env=env,
+            capture_output=True, text=True, check=True,
+        ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("COLD_START_BUDGET_MS", 1500)))
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    results = [measure_once() for _ in range(args.runs)]
+    best = min(results, key=lambda r: r["import_ms"] + r["first_request_ms"])
+    total = best["import_ms"] + best["first_request_ms"]
+
+    print(f"import main:    {best['import_ms']:8.1f} ms")
+    print(f"first request:  {best['first_request_ms']:8.1f} ms")
+    for name, ms in best["startup"]["phases_ms"].items():
+        print(f"  {name:<14}{ms:8.1f} ms")
+    print(f"total:          {total:8.1f} ms (budget {args.budget_ms:.0f} ms)")
+
+    heavy = [m for m in ("openai", "httpx", "slowapi") if _imported_on_boot(m)]
+    if heavy:
+        print(f"FAIL: {', '.join(heavy)} imported at startup")
+        return 1
+    if total > args.budget_ms:
+        print("FAIL: over cold-start budget")
+        return 1
+    return 0
+
+
+def _imported_on_boot(module: str) -> bool:
+    code = f"import sys, main; print({module!r} in sys.modules)"
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR)
+    with tempfile.TemporaryDirectory() as tmp:
+        out = subprocess.run([sys.executable, "-c", code], cwd=tmp, env=env,
+                             capture_output=True, text=True, check=True).stdout
+    return out.strip() == "True"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
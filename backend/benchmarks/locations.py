@@ -0,0 +1,80 @@
+# backend/benchmarks/locations.py
+"""
+Location parser throughput on 100k location strings.
+
+    cd backend && python -m benchmarks.locations [--n 100000] [--corpus locations.txt]
+
+With --corpus, strings are read one per line (e.g. dumped from a real jobs
+feed). Otherwise a corpus is synthesized from the shapes Lever/Greenhouse
+boards actually use ("City, ST", "Remote - US", "A / B", "n/a", ...), with a
+long tail of one-off strings so the uncached path is exercised too.
+"""
+import argparse
+import random
+import time
+
+from gazetteer import CITIES, COUNTRIES
+from locations import _parse, parse_location
+
+_FORMATS = [
+    "{city}, {region}", "{city}, {region}, {country}", "{city}", "{city}, {country}",
+    "Remote", "Remote - {country}", "Remote ({country})", "{country}-Remote", "Remote, {country}",
+    "{city}, {region} / Remote ({country})", "{city} or Remote", "Hybrid - {city}",
+    "{city}, {region} (Hybrid)", "{city}; {city2}", "{city} | {city2} | {city3}",
+    "n/a", "Multiple Locations", "{city}, {region} - HQ", "Remote-first (EMEA)",
+]
+
+
+def synth(n: int, seed: int = 7):
+    rng = random.Random(seed)
+    cities = [c for c in CITIES.values()]
+    names = {v: k for k, v in COUNTRIES.items()}  # ISO2 -> one alias
+    out = []
+    for i in range(n):
+        city, country, region = rng.choice(cities)
+        c2, c3 = rng.choice(cities)[0], rng.choice(cities)[0]
+        fmt = rng.choice(_FORMATS)
+        s = fmt.format(
+            city=city, city2=c2, city3=c3,
+            region=(region or "").split("-")[-1] or names.get(country, country),
+            country=rng.choice([country, names.get(country, country).title()]),
+        )
+        if rng.random() < 0.15:  # long tail: small towns / typos / office names
+            s = f"{s} (Office {i})"
+        out.append(s)
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--corpus")
+    args = parser.parse_args()
+
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as f:
+            corpus = [line.rstrip("\n") for line in f][: args.n]
+    else:
+        corpus = synth(args.n)
+    distinct = len(set(corpus))
+
+    t0 = time.perf_counter()
+    for s in corpus:
+        _parse(s)
+    t_raw = time.perf_counter() - t0
+
+    parse_location.cache_clear()
+    t0 = time.perf_counter()
+    parsed = [parse_location(s) for s in corpus]
+    t_cached = time.perf_counter() - t0
+
+    with_place = sum(1 for p in parsed if p.places)
+    remote = sum(1 for p in parsed if p.remote)
+    print(f"{len(corpus):,} strings ({distinct:,} distinct); "
+          f"{with_place / len(corpus):.1%} resolved to a place, {remote / len(corpus):.1%} remote")
+    print(f"uncached parser   {t_raw:6.2f} s  {len(corpus) / t_raw:10,.0f} strings/s")
+    print(f"cached (1st pass) {t_cached:6.2f} s  {len(corpus) / t_cached:10,.0f} strings/s  {parse_location.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
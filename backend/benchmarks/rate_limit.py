@@ -0,0 +1,62 @@
+# backend/benchmarks/rate_limit.py
+"""
+Per-request overhead of the GCRA limiter, per storage backend.
+
+    cd backend && python -m benchmarks.rate_limit [--n 20000] [--redis redis://localhost:6379/0]
+
+Measures both the raw store step and a full GET through the app with the
+limiter on vs. off, so the difference is what the limiter adds end to end.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from rate_limit import MemoryStore, RedisStore, SQLiteStore
+
+
+def bench_store(name, store, n: int) -> None:
+    keys = [f"10.0.{i // 256}.{i % 256}" for i in range(1000)]
+    t0 = time.perf_counter()
+    for i in range(n):
+        store.hit(keys[i % len(keys)], 1, 0.001, 1e9)
+    dt = time.perf_counter() - t0
+    print(f"{name:<10} {dt / n * 1e6:8.2f} us/check  ({n / dt:,.0f} checks/s)")
+
+
+def bench_app(n: int, storage: str) -> None:
+    os.environ["RATE_LIMIT_STORAGE"] = storage
+    os.environ["RATE_LIMIT_PER_MINUTE"] = "1000000000"
+    from fastapi.testclient import TestClient
+    import main
+
+    with TestClient(main.app) as client:
+        timings = {}
+        for enabled in ("0", "1"):
+            os.environ["RATE_LIMIT_ENABLED"] = enabled
+            client.get("/jobs")
+            t0 = time.perf_counter()
+            for _ in range(n):
+                client.get("/jobs")
+            timings[enabled] = (time.perf_counter() - t0) / n * 1e6
+    print(f"GET /jobs  off {timings['0']:8.1f} us  on {timings['1']:8.1f} us  "
+          f"overhead {timings['1'] - timings['0']:+.1f} us/request ({storage.split(':')[0]})")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--redis", default=os.getenv("REDIS_URL"))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # keep data.db / ratelimit.db out of the tree
+        bench_store("memory", MemoryStore(), args.n)
+        bench_store("sqlite", SQLiteStore(os.path.join(tmp, "rl.db")), args.n)
+        if args.redis:
+            bench_store("redis", RedisStore(args.redis), args.n)
+        bench_app(args.n // 10, f"sqlite:///{os.path.join(tmp, 'app-rl.db')}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# backend/benchmarks/score_answers.py
+"""
+Answer scoring: the previous per-keyword `in answer.lower()` scan vs. the
+compiled Aho-Corasick matcher, with 200 keywords x 1,000 answers.
+
+    cd backend && python -m benchmarks.score_answers [--keywords 200] [--answers 1000]
+"""
+import argparse
+import random
+import time
+
+from ai.job_tools import EXAMPLE_PHRASES, score_answer, score_answers
+from ai.matcher import _compile
+
+VOCAB = (
+    "python java kubernetes docker terraform react typescript postgres redis kafka spark "
+    "airflow graphql grpc rust golang aws gcp azure linux pandas numpy pytorch tensorflow "
+    "fastapi django flask celery nginx prometheus grafana ci cd testing latency throughput"
+).split()
+
+
+def old_score_answer(question, answer, job_keywords):
+    """The implementation before the matcher, kept here as the baseline."""
+    length = len(answer.split())
+    has_examples = any(x in answer.lower() for x in ["for example", "e.g.", "for instance", "i built", "i designed"])
+    keyword_hits = sum(1 for k in job_keywords if k.lower() in answer.lower())
+    return length, has_examples, keyword_hits
+
+
+def make_data(n_keywords: int, n_answers: int):
+    rng = random.Random(42)
+    keywords = list(dict.fromkeys(
+        rng.choice(VOCAB) + ("" if i < len(VOCAB) else f"-{i}") for i in range(n_keywords * 2)
+    ))[:n_keywords]
+    filler = "we shipped the feature and measured the impact on users over the quarter".split()
+    answers = []
+    for _ in range(n_answers):
+        words = [rng.choice(filler) for _ in range(rng.randint(60, 200))]
+        for _ in range(rng.randint(0, 8)):
+            words.insert(rng.randrange(len(words)), rng.choice(keywords).upper())
+        if rng.random() < 0.5:
+            words.insert(0, rng.choice(EXAMPLE_PHRASES).capitalize())
+        answers.append(" ".join(words))
+    return keywords, answers
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keywords", type=int, default=200)
+    parser.add_argument("--answers", type=int, default=1000)
+    args = parser.parse_args()
+
+    keywords, answers = make_data(args.keywords, args.answers)
+    items = [("Q", a) for a in answers]
+
+    t0 = time.perf_counter()
+    old = [old_score_answer("Q", a, keywords) for a in answers]
+    t_old = time.perf_counter() - t0
+
+    _compile.cache_clear()
+    t0 = time.perf_counter()
+    single = [score_answer("Q", a, keywords) for a in answers]
+    t_single = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    batch = score_answers(items, keywords)
+    t_batch = time.perf_counter() - t0
+
+    assert single == batch
+    for (length, has_ex, hits), res in zip(old, batch):
+        expected = min(4.0, length / 40.0) + (3.0 if has_ex else 0) + min(3.0, hits * 0.6)
+        assert res["score"] == round(min(10.0, expected), 2)
+
+    chars = sum(len(a) for a in answers)
+    print(f"{len(keywords)} keywords x {len(answers)} answers ({chars / 1e6:.2f} MB of text)")
+    print(f"per-keyword scan (old) {t_old * 1000:8.1f} ms")
+    print(f"score_answer (cached)  {t_single * 1000:8.1f} ms  {t_old / t_single:5.1f}x")
+    print(f"score_answers (batch)  {t_batch * 1000:8.1f} ms  {t_old / t_batch:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# backend/benchmarks/serialization.py
+"""
+GET /applications before/after: the old `response_model=List[Application]`
+path (ORM rows -> Pydantic validation -> jsonable_encoder -> json) vs. the
+orjson row stream, at 10k and 100k rows.
+
+    cd backend && python -m benchmarks.serialization [--rows 10000 100000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def seed(n: int) -> None:
+    from db import engine, init_db
+    from models import Application
+
+    init_db()
+    now = datetime.utcnow()
+    rows = [
+        {"company": f"company-{i % 500}", "role": "Software Engineer Intern", "url": f"https://example.com/{i}",
+         "status": "APPLIED", "notes": "Referred by a friend; follow up next week.", "applied_at": now, "updated_at": now}
+        for i in range(n)
+    ]
+    with engine.begin() as conn:
+        conn.execute(Application.__table__.delete())
+        conn.execute(Application.__table__.insert(), rows)
+
+
+def old_app():
+    """The pre-change handler, mounted on a bare FastAPI app."""
+    from fastapi import FastAPI
+    from sqlmodel import select
+    from db import get_session
+    from models import Application
+
+    app = FastAPI()
+
+    @app.get("/applications/", response_model=List[Application])
+    def list_apps():
+        with get_session() as session:
+            return session.exec(select(Application)).all()
+
+    return app
+
+
+def timed(client, url: str):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    r = client.get(url)
+    dt = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert r.status_code == 200
+    return dt, peak, r.content
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)  # db.py uses ./data.db
+        os.environ["RATE_LIMIT_ENABLED"] = "0"
+        sys.path.insert(0, BACKEND_DIR)
+        import orjson
+        from fastapi.testclient import TestClient
+        import main as app_main
+
+        old = TestClient(old_app())
+        with TestClient(app_main.app) as new:
+            for n in args.rows:
+                seed(n)
+                t_old, m_old, body_old = timed(old, "/applications/")
+                t_new, m_new, body_new = timed(new, "/applications/")
+                t_nd, m_nd, _ = timed(new, "/applications/?format=ndjson")
+                assert orjson.loads(body_old) == orjson.loads(body_new)
+                print(f"{n:>7} rows  before {t_old * 1000:8.1f} ms (peak {m_old / 2**20:6.1f} MiB)  "
+                      f"after {t_new * 1000:7.1f} ms (peak {m_new / 2**20:5.1f} MiB)  "
+                      f"ndjson {t_nd * 1000:7.1f} ms  {t_old / t_new:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,17 +3,53 @@ from sqlmodel import SQLModel, create_engine, Session
 ##
 DATABASE_URL = "sqlite:///./data.db"
 
+# Stored in SQLite's PRAGMA user_version, which is a single header read.
+# Bumping it only makes init_db() create tables that are missing; create_all
+# never alters existing tables, so a column change needs a real migration
+# (ALTER TABLE) before the version is bumped.
+SCHEMA_VERSION = 1
+
 engine = create_engine(
     DATABASE_URL,
     echo=False,
     connect_args={"check_same_thread": False},
 )
 
-def init_db() -> None:
-    SQLModel.metadata.create_all(engine)
+
+def _get_schema_version(conn) -> int:
+    return int(conn.exec_driver_sql("PRAGMA user_version").scalar() or 0)
+
+
+def init_db() -> bool:
+    """
+    Make sure the schema is current. Returns True if tables had to be created.
+
+    The common case (schema already at SCHEMA_VERSION) costs one PRAGMA read
+    instead of the table-by-table reflection that create_all() does.
+    """
+    import models  # noqa: F401  (registers the tables on SQLModel.metadata)
+
+    with engine.connect() as conn:
+        if _get_schema_version(conn) >= SCHEMA_VERSION:
+            return False
+
+    # Several uvicorn workers can boot at once: take SQLite's write lock and
+    # re-check, so only one of them creates the tables.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            if _get_schema_version(conn) >= SCHEMA_VERSION:
+                conn.exec_driver_sql("COMMIT")
+                return False
+            SQLModel.metadata.create_all(conn)
+            conn.exec_driver_sql(f"PRAGMA user_version = {int(SCHEMA_VERSION)}")
+            conn.exec_driver_sql("COMMIT")
+        except Exception:
+            conn.exec_driver_sql("ROLLBACK")
+            raise
+    return True
 
 @contextmanager
 def get_session() -> Session:
     with Session(engine) as session:
         yield session
-
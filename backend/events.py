@@ -0,0 +1,292 @@
+# backend/events.py
+"""
+Change feed: a versioned pub/sub bus for compact deltas.
+
+Producers (the jobs refresh and the application CRUD handlers) publish
+{"topic", "added", "updated", "removed"} with lists of IDs; every event gets
+a version from one monotonically increasing counter, so a client can resume
+from a cursor and only pull what changed since then.
+
+The event log lives in a backend chosen by EVENTS_STORAGE, mirroring
+RATE_LIMIT_STORAGE:
+  - "memory"               per-process log (single worker / dev stand-in)
+  - "sqlite:///path.db"    shared by all uvicorn workers on one host (default)
+  - "redis://host:6379/0"  shared across hosts (needs the `redis` package)
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Protocol, Set, Tuple
+
+import orjson
+
+DEFAULT_STORAGE = "sqlite:///./events.db"
+RETAIN = 1000        # events kept for resuming clients
+POLL_INTERVAL = 0.5  # how often to look for events published by other workers
+
+Event = Dict[str, object]
+
+logger = logging.getLogger("uvicorn.error")
+
+
+# --------- Backends ---------
+
+class Backend(Protocol):
+    def append(self, topic: str, data: dict) -> int:
+        """Store an event and return its version."""
+        ...
+
+    def since(self, version: int, limit: int = RETAIN) -> List[Event]:
+        """Events with version > `version`, oldest first."""
+        ...
+
+    def head(self) -> int:
+        """Latest version (0 if nothing was published yet)."""
+        ...
+
+    def oldest(self) -> int:
+        """Oldest retained version (0 if the log is empty)."""
+        ...
+
+
+def _event(version: int, topic: str, data: dict) -> Event:
+    return {"version": version, "topic": topic, **data}
+
+
+class MemoryBackend:
+    def __init__(self, retain: int = RETAIN):
+        self._log: deque = deque(maxlen=retain)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def append(self, topic: str, data: dict) -> int:
+        with self._lock:
+            self._version += 1
+            self._log.append(_event(self._version, topic, data))
+            return self._version
+
+    def since(self, version: int, limit: int = RETAIN) -> List[Event]:
+        with self._lock:
+            return [e for e in self._log if e["version"] > version][:limit]
+
+    def head(self) -> int:
+        return self._version
+
+    def oldest(self) -> int:
+        with self._lock:
+            return self._log[0]["version"] if self._log else 0
+
+
+class SQLiteBackend:
+    """
+    Host-local log shared across uvicorn workers. AUTOINCREMENT keeps
+    versions strictly increasing even after old rows are trimmed.
+    """
+
+    def __init__(self, path: str, retain: int = RETAIN):
+        self.path = path
+        self.retain = retain
+        self._local = threading.local()
+        self._conn().execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            "version INTEGER PRIMARY KEY AUTOINCREMENT, topic TEXT NOT NULL, data BLOB NOT NULL)"
+        )
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def append(self, topic: str, data: dict) -> int:
+        conn = self._conn()
+        cur = conn.execute("INSERT INTO events (topic, data) VALUES (?, ?)", (topic, orjson.dumps(data)))
+        version = cur.lastrowid
+        if version % 100 == 0:
+            conn.execute("DELETE FROM events WHERE version <= ?", (version - self.retain,))
+        return version
+
+    def since(self, version: int, limit: int = RETAIN) -> List[Event]:
+        rows = self._conn().execute(
+            "SELECT version, topic, data FROM events WHERE version > ? ORDER BY version LIMIT ?",
+            (version, limit),
+        ).fetchall()
+        return [_event(v, t, orjson.loads(d)) for v, t, d in rows]
+
+    def head(self) -> int:
+        row = self._conn().execute("SELECT seq FROM sqlite_sequence WHERE name = 'events'").fetchone()
+        return int(row[0]) if row else 0
+
+    def oldest(self) -> int:
+        row = self._conn().execute("SELECT MIN(version) FROM events").fetchone()
+        return int(row[0] or 0)
+
+
+# INCR + ZADD in one script so versions and log order can't diverge.
+_REDIS_APPEND = """
+local v = redis.call('INCR', KEYS[1])
+redis.call('ZADD', KEYS[2], v, cjson.encode({v, ARGV[1], ARGV[2]}))
+redis.call('ZREMRANGEBYRANK', KEYS[2], 0, -(tonumber(ARGV[3]) + 1))
+return v
+"""
+
+
+class RedisBackend:
+    def __init__(self, url: str, prefix: str = "events:", retain: int = RETAIN):
+        try:
+            import redis  # optional dependency, only needed in production
+        except ImportError:
+            raise RuntimeError("EVENTS_STORAGE is a Redis URL but the `redis` package is not installed") from None
+
+        self._client = redis.Redis.from_url(url)
+        self._append = self._client.register_script(_REDIS_APPEND)
+        self._seq, self._log = prefix + "seq", prefix + "log"
+        self.retain = retain
+
+    def append(self, topic: str, data: dict) -> int:
+        return int(self._append(keys=[self._seq, self._log], args=[topic, orjson.dumps(data), self.retain]))
+
+    def since(self, version: int, limit: int = RETAIN) -> List[Event]:
+        raw = self._client.zrangebyscore(self._log, f"({version}", "+inf", start=0, num=limit)
+        events = []
+        for item in raw:
+            v, topic, data = orjson.loads(item)
+            events.append(_event(int(v), topic, orjson.loads(data)))
+        return events
+
+    def head(self) -> int:
+        return int(self._client.get(self._seq) or 0)
+
+    def oldest(self) -> int:
+        first = self._client.zrange(self._log, 0, 0, withscores=True)
+        return int(first[0][1]) if first else 0
+
+
+def make_backend(url: str) -> Backend:
+    if url == "memory":
+        return MemoryBackend()
+    if url.startswith("sqlite:///"):
+        return SQLiteBackend(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(url)
+    raise ValueError(f"Unsupported EVENTS_STORAGE: {url!r}")
+
+
+# --------- Bus ---------
+
+class EventBus:
+    def __init__(self, storage: Optional[str] = None):
+        self._storage = storage
+        self._backend: Optional[Backend] = None
+        self._lock = threading.Lock()
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+        self._head = 0  # newest version seen by this process
+        self._poller: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> Backend:
+        if self._backend is None:
+            with self._lock:
+                if self._backend is None:
+                    self._backend = make_backend(self._storage or os.getenv("EVENTS_STORAGE", DEFAULT_STORAGE))
+        return self._backend
+
+    def publish(
+        self,
+        topic: str,
+        added: Iterable = (),
+        updated: Iterable = (),
+        removed: Iterable = (),
+        **extra,
+    ) -> int:
+        """Record a delta and wake local subscribers. Safe to call from any thread."""
+        data = {"added": list(added), "updated": list(updated), "removed": list(removed), **extra}
+        version = self.backend.append(topic, data)
+        self._advance(version)
+        return version
+
+    def _advance(self, head: int) -> None:
+        """Record a newer head and wake every waiter in this process."""
+        with self._lock:
+            if head <= self._head:
+                return
+            self._head = head
+            waiters = list(self._waiters)
+        for loop, ev in waiters:
+            loop.call_soon_threadsafe(ev.set)
+
+    def _poll(self) -> None:
+        # One thread per process picks up other workers' publishes, however
+        # many connections are waiting; it exits once nobody is.
+        while True:
+            with self._lock:
+                if not self._waiters:
+                    self._poller = None
+                    return
+            try:
+                self._advance(self.head())
+            except Exception:
+                logger.exception("Failed to poll the change feed")
+            time.sleep(POLL_INTERVAL)
+
+    def notify(self, topic: str, **delta) -> Optional[int]:
+        """
+        publish() for callers whose write has already committed: a feed
+        outage is logged rather than turning a saved change into an error.
+        """
+        try:
+            return self.publish(topic, **delta)
+        except Exception:
+            logger.exception("Failed to publish %s change event", topic)
+            return None
+
+    def since(self, version: int, limit: int = RETAIN) -> List[Event]:
+        return self.backend.since(version, limit)
+
+    def head(self) -> int:
+        return self.backend.head()
+
+    def oldest(self) -> int:
+        return self.backend.oldest()
+
+    async def wait(self, version: int, timeout: float) -> bool:
+        """
+        Wait until something newer than `version` exists or `timeout` passes.
+        Local publishes wake us immediately; other workers' are picked up by
+        the process-wide poller within POLL_INTERVAL. Nothing here touches
+        the backend, so an open stream costs no thread hops while it idles.
+        """
+        loop = asyncio.get_running_loop()
+        ev = asyncio.Event()
+        waiter = (loop, ev)
+        with self._lock:
+            self._waiters.add(waiter)
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll, name="events-poller", daemon=True)
+                self._poller.start()
+        try:
+            deadline = loop.time() + timeout
+            while self._head <= version:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(ev.wait(), remaining)
+                except asyncio.TimeoutError:
+                    pass
+                ev.clear()
+            return True
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+bus = EventBus()
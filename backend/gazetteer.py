@@ -0,0 +1,209 @@
+# backend/gazetteer.py
+"""
+Small offline gazetteer for normalizing job locations.
+
+Keys are lowercase aliases; countries map to ISO 3166-1 alpha-2 codes and
+regions to ISO 3166-2 style codes ("US-CA", "CA-ON"). Cities only need to
+cover where postings actually cluster — anything else still parses from its
+"City, Region" / "City, Country" shape.
+"""
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# alias -> ISO2
+COUNTRIES: Dict[str, str] = {
+    "united states": "US", "united states of america": "US", "usa": "US", "us": "US", "u.s.": "US",
+    "u.s.a.": "US", "america": "US",
+    "canada": "CA", "can": "CA",
+    "mexico": "MX", "brazil": "BR", "brasil": "BR", "argentina": "AR", "chile": "CL", "colombia": "CO",
+    "peru": "PE", "uruguay": "UY", "costa rica": "CR",
+    "united kingdom": "GB", "uk": "GB", "u.k.": "GB", "great britain": "GB", "england": "GB",
+    "scotland": "GB", "wales": "GB", "northern ireland": "GB", "gb": "GB",
+    "ireland": "IE", "germany": "DE", "deutschland": "DE", "france": "FR", "spain": "ES", "españa": "ES",
+    "portugal": "PT", "italy": "IT", "netherlands": "NL", "the netherlands": "NL", "holland": "NL",
+    "belgium": "BE", "luxembourg": "LU", "switzerland": "CH", "austria": "AT", "denmark": "DK",
+    "sweden": "SE", "norway": "NO", "finland": "FI", "iceland": "IS", "poland": "PL",
+    "czech republic": "CZ", "czechia": "CZ", "hungary": "HU", "romania": "RO", "bulgaria": "BG",
+    "greece": "GR", "serbia": "RS", "croatia": "HR", "ukraine": "UA", "estonia": "EE", "latvia": "LV",
+    "lithuania": "LT", "turkey": "TR", "türkiye": "TR", "israel": "IL",
+    "united arab emirates": "AE", "uae": "AE", "saudi arabia": "SA", "egypt": "EG", "nigeria": "NG",
+    "kenya": "KE", "south africa": "ZA",
+    "india": "IN", "pakistan": "PK", "bangladesh": "BD", "sri lanka": "LK", "china": "CN",
+    "hong kong": "HK", "taiwan": "TW", "japan": "JP", "south korea": "KR", "korea": "KR",
+    "singapore": "SG", "malaysia": "MY", "indonesia": "ID", "philippines": "PH", "vietnam": "VN",
+    "thailand": "TH", "australia": "AU", "new zealand": "NZ",
+}
+
+# Multi-country blocs and markets, mostly seen as remote qualifiers
+# ("Remote (EMEA)", "EU-only"). Nothing we index is that coarse, so they are
+# recognized and dropped rather than parsed as a city.
+BLOCS: FrozenSet[str] = frozenset({
+    "eu", "e.u.", "european union", "eea", "europe", "emea", "dach", "benelux", "nordics", "cee",
+    "apac", "apj", "asia", "asia pacific", "anz", "mena", "middle east", "africa",
+    "latam", "lat am", "americas", "amer", "north america", "south america",
+    "global", "worldwide", "international",
+})
+
+# alias -> (country, region code)
+REGIONS: Dict[str, Tuple[str, str]] = {}
+
+_US_STATES = {
+    "AL": "alabama", "AK": "alaska", "AZ": "arizona", "AR": "arkansas", "CA": "california",
+    "CO": "colorado", "CT": "connecticut", "DE": "delaware", "DC": "district of columbia",
+    "FL": "florida", "GA": "georgia", "HI": "hawaii", "ID": "idaho", "IL": "illinois",
+    "IN": "indiana", "IA": "iowa", "KS": "kansas", "KY": "kentucky", "LA": "louisiana",
+    "ME": "maine", "MD": "maryland", "MA": "massachusetts", "MI": "michigan", "MN": "minnesota",
+    "MS": "mississippi", "MO": "missouri", "MT": "montana", "NE": "nebraska", "NV": "nevada",
+    "NH": "new hampshire", "NJ": "new jersey", "NM": "new mexico", "NY": "new york",
+    "NC": "north carolina", "ND": "north dakota", "OH": "ohio", "OK": "oklahoma", "OR": "oregon",
+    "PA": "pennsylvania", "RI": "rhode island", "SC": "south carolina", "SD": "south dakota",
+    "TN": "tennessee", "TX": "texas", "UT": "utah", "VT": "vermont", "VA": "virginia",
+    "WA": "washington", "WV": "west virginia", "WI": "wisconsin", "WY": "wyoming", "PR": "puerto rico",
+}
+_CA_PROVINCES = {
+    "AB": "alberta", "BC": "british columbia", "MB": "manitoba", "NB": "new brunswick",
+    "NL": "newfoundland and labrador", "NS": "nova scotia", "NT": "northwest territories",
+    "NU": "nunavut", "ON": "ontario", "PE": "prince edward island", "QC": "quebec",
+    "SK": "saskatchewan", "YT": "yukon",
+}
+for _code, _name in _US_STATES.items():
+    REGIONS[_name] = ("US", f"US-{_code}")
+    REGIONS[_code.lower()] = ("US", f"US-{_code}")
+for _code, _name in _CA_PROVINCES.items():
+    REGIONS[_name] = ("CA", f"CA-{_code}")
+    # Province abbreviations collide with US states / common words ("on"),
+    # so they are only trusted after a comma (see PROVINCE_CODES).
+PROVINCE_CODES: Dict[str, Tuple[str, str]] = {c.lower(): ("CA", f"CA-{c}") for c in _CA_PROVINCES}
+REGIONS["québec"] = ("CA", "CA-QC")
+
+# alias -> (canonical city, country, region code or None)
+CITIES: Dict[str, Tuple[str, str, Optional[str]]] = {}
+
+
+def _city(name: str, country: str, region: Optional[str] = None, *aliases: str) -> None:
+    entry = (name, country, region)
+    CITIES[name.lower()] = entry
+    for a in aliases:
+        CITIES[a] = entry
+
+
+# --- United States ---
+_city("San Francisco", "US", "US-CA", "sf", "san fran", "s.f.")
+_city("San Francisco Bay Area", "US", "US-CA", "bay area", "sf bay area")
+_city("San Jose", "US", "US-CA")
+_city("Mountain View", "US", "US-CA")
+_city("Palo Alto", "US", "US-CA")
+_city("Menlo Park", "US", "US-CA")
+_city("Sunnyvale", "US", "US-CA")
+_city("Santa Clara", "US", "US-CA")
+_city("Cupertino", "US", "US-CA")
+_city("Redwood City", "US", "US-CA")
+_city("San Mateo", "US", "US-CA")
+_city("Oakland", "US", "US-CA")
+_city("Berkeley", "US", "US-CA")
+_city("Los Angeles", "US", "US-CA", "la", "l.a.")
+_city("Santa Monica", "US", "US-CA")
+_city("Irvine", "US", "US-CA")
+_city("San Diego", "US", "US-CA")
+_city("Sacramento", "US", "US-CA")
+_city("Seattle", "US", "US-WA")
+_city("Bellevue", "US", "US-WA")
+_city("Redmond", "US", "US-WA")
+_city("Kirkland", "US", "US-WA")
+_city("Portland", "US", "US-OR")
+_city("New York", "US", "US-NY", "nyc", "new york city", "manhattan", "brooklyn")
+_city("Boston", "US", "US-MA")
+_city("Cambridge", "US", "US-MA")
+_city("Washington", "US", "US-DC", "washington dc", "washington d.c.", "d.c.")
+_city("Arlington", "US", "US-VA")
+_city("Reston", "US", "US-VA")
+_city("Chicago", "US", "US-IL")
+_city("Austin", "US", "US-TX")
+_city("Dallas", "US", "US-TX")
+_city("Houston", "US", "US-TX")
+_city("San Antonio", "US", "US-TX")
+_city("Denver", "US", "US-CO")
+_city("Boulder", "US", "US-CO")
+_city("Atlanta", "US", "US-GA")
+_city("Miami", "US", "US-FL")
+_city("Tampa", "US", "US-FL")
+_city("Orlando", "US", "US-FL")
+_city("Raleigh", "US", "US-NC")
+_city("Durham", "US", "US-NC")
+_city("Charlotte", "US", "US-NC")
+_city("Nashville", "US", "US-TN")
+_city("Salt Lake City", "US", "US-UT", "slc")
+_city("Lehi", "US", "US-UT")
+_city("Phoenix", "US", "US-AZ")
+_city("Scottsdale", "US", "US-AZ")
+_city("Las Vegas", "US", "US-NV")
+_city("Minneapolis", "US", "US-MN")
+_city("Detroit", "US", "US-MI")
+_city("Ann Arbor", "US", "US-MI")
+_city("Pittsburgh", "US", "US-PA")
+_city("Philadelphia", "US", "US-PA")
+_city("Columbus", "US", "US-OH")
+_city("Madison", "US", "US-WI")
+_city("St. Louis", "US", "US-MO", "st louis", "saint louis")
+_city("Kansas City", "US", "US-MO")
+_city("Baltimore", "US", "US-MD")
+_city("Santa Barbara", "US", "US-CA")
+# --- Canada ---
+_city("Toronto", "CA", "CA-ON")
+_city("Waterloo", "CA", "CA-ON")
+_city("Ottawa", "CA", "CA-ON")
+_city("Montreal", "CA", "CA-QC", "montréal")
+_city("Vancouver", "CA", "CA-BC")
+_city("Calgary", "CA", "CA-AB")
+_city("Edmonton", "CA", "CA-AB")
+# --- Europe / Middle East ---
+_city("London", "GB", None)
+_city("Manchester", "GB", None)
+_city("Edinburgh", "GB", None)
+_city("Dublin", "IE", None)
+_city("Amsterdam", "NL", None)
+_city("Berlin", "DE", None)
+_city("Munich", "DE", None, "münchen")
+_city("Hamburg", "DE", None)
+_city("Frankfurt", "DE", None)
+_city("Paris", "FR", None)
+_city("Madrid", "ES", None)
+_city("Barcelona", "ES", None)
+_city("Lisbon", "PT", None, "lisboa")
+_city("Milan", "IT", None, "milano")
+_city("Zurich", "CH", None, "zürich")
+_city("Geneva", "CH", None)
+_city("Stockholm", "SE", None)
+_city("Copenhagen", "DK", None)
+_city("Oslo", "NO", None)
+_city("Helsinki", "FI", None)
+_city("Warsaw", "PL", None)
+_city("Krakow", "PL", None, "kraków")
+_city("Prague", "CZ", None)
+_city("Vienna", "AT", None)
+_city("Brussels", "BE", None)
+_city("Tel Aviv", "IL", None, "tel aviv-yafo")
+_city("Dubai", "AE", None)
+# --- Asia-Pacific ---
+_city("Bangalore", "IN", None, "bengaluru")
+_city("Hyderabad", "IN", None)
+_city("Pune", "IN", None)
+_city("Mumbai", "IN", None)
+_city("Chennai", "IN", None)
+_city("Gurgaon", "IN", None, "gurugram")
+_city("Noida", "IN", None)
+_city("New Delhi", "IN", None, "delhi")
+_city("Singapore", "SG", None)
+_city("Tokyo", "JP", None)
+_city("Seoul", "KR", None)
+_city("Beijing", "CN", None)
+_city("Shanghai", "CN", None)
+_city("Shenzhen", "CN", None)
+_city("Taipei", "TW", None)
+_city("Sydney", "AU", None)
+_city("Melbourne", "AU", None)
+_city("Auckland", "NZ", None)
+# --- Latin America ---
+_city("Mexico City", "MX", None, "cdmx", "ciudad de méxico")
+_city("São Paulo", "BR", None, "sao paulo")
+_city("Buenos Aires", "AR", None)
+_city("Bogotá", "CO", None, "bogota")
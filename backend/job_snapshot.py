@@ -0,0 +1,358 @@
+# backend/job_snapshot.py
+"""
+Immutable, versioned job snapshot shared by every uvicorn worker via mmap.
+
+A refresh publishes one file (written to a temp name, fsync'd, then
+os.replace'd so readers never see a partial write). Each worker maps the file
+read-only and re-maps only when the file on disk changes, so N workers share
+one copy of the data through the page cache.
+
+File layout (little-endian):
+
+    header   8s magic | u64 version | u64 created_ms | u32 count | u32 nsections
+    toc      nsections x (u64 offset, u64 length) — absolute, 8-byte aligned
+    sections
+      OFFSETS      (count + 1) x u64 — byte offset of record i inside BODY;
+                   offsets[count] == len(body)
+      BODY         pre-serialized JSON array: [rec0,rec1,...,recN-1]
+      URL_OFFSETS  (n + 1) x u64 into URL_KEYS
+      URL_KEYS     the distinct job URLs, sorted, concatenated
+      URL_POS      n x u32 — record position of each URL (its newest record)
+      LOC_OFFSETS  (k + 1) x u64 into LOC_KEYS
+      LOC_KEYS     location index keys ("city:berlin", "remote:1", ...), sorted
+      POST_OFFSETS (k + 1) x u64 — start of each key's run inside POSTINGS
+      POSTINGS     u32 record positions, ascending within each key
+      RAW_OFFSETS  (count + 1) x u64 into RAW
+      RAW          lowercased raw location of each record, NUL-terminated
+
+Records are stored newest first, so rec i .. rec j-1 is body[offsets[i]:
+offsets[j] - 1] (the byte before offsets[j] is the "," or "]" separator).
+Lookup tables are built at publish time and searched in place, so no worker
+decodes the body or keeps its own copy of an index.
+"""
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import orjson
+
+from jobs_fetchers import Job
+from locations import index_keys, query_keys
+
+MAGIC = b"JOBSNAP2"
+_HEADER = struct.Struct("<8sQQII")
+_SECTION = struct.Struct("<QQ")
+# Tables are read in place with memoryview.cast, which uses native byte order.
+if sys.byteorder != "little":
+    raise ImportError("job_snapshot reads little-endian tables in place; big-endian hosts are unsupported")
+
+logger = logging.getLogger("uvicorn.error")
+
+_SECTIONS = (
+    "offsets", "body", "url_offsets", "url_keys", "url_pos",
+    "loc_offsets", "loc_keys", "post_offsets", "postings", "raw_offsets", "raw",
+)
+
+DEFAULT_PATH = "./jobs.snapshot"
+
+
+def snapshot_path() -> str:
+    return os.getenv("JOBS_SNAPSHOT_PATH", DEFAULT_PATH)
+
+
+def _sort_key(job: Job) -> int:
+    return int(job.get("ts") or 0)
+
+
+def _u64(values: Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(values)}Q", *values)
+
+
+def _u32(values: Sequence[int]) -> bytes:
+    return struct.pack(f"<{len(values)}I", *values)
+
+
+def _string_table(keys: Sequence[bytes]) -> Tuple[bytes, bytes]:
+    """(offsets, blob) for already-sorted keys; see _StringTable."""
+    offsets = [0]
+    for k in keys:
+        offsets.append(offsets[-1] + len(k))
+    return _u64(offsets), b"".join(keys)
+
+
+def encode(jobs: Iterable[Job], version: int) -> bytes:
+    """Serialize jobs (newest first) and their lookup tables into the snapshot layout."""
+    jobs = sorted(jobs, key=_sort_key, reverse=True)
+    records = [orjson.dumps(j) for j in jobs]
+    offsets: List[int] = []
+    pos = 1  # after "["
+    for rec in records:
+        offsets.append(pos)
+        pos += len(rec) + 1  # record + "," (or the closing "]")
+    body = b"[" + b",".join(records) + b"]"
+    offsets.append(len(body) if records else 1)
+
+    urls: Dict[bytes, int] = {}
+    for i, job in enumerate(jobs):
+        urls.setdefault(str(job.get("url")).encode(), i)
+    url_keys = sorted(urls)
+
+    postings: Dict[bytes, List[int]] = {}
+    raw_offsets = [0]
+    raw: List[bytes] = []
+    for i, job in enumerate(jobs):
+        for key in dict.fromkeys(index_keys(job)):
+            postings.setdefault(key.encode(), []).append(i)
+        loc = str(job.get("location") or "").lower().encode().replace(b"\0", b" ") + b"\0"
+        raw.append(loc)
+        raw_offsets.append(raw_offsets[-1] + len(loc))
+    loc_keys = sorted(postings)
+    post_offsets = [0]
+    for k in loc_keys:
+        post_offsets.append(post_offsets[-1] + len(postings[k]))
+
+    sections = [
+        _u64(offsets), body,
+        *_string_table(url_keys), _u32([urls[k] for k in url_keys]),
+        *_string_table(loc_keys), _u64(post_offsets), _u32([i for k in loc_keys for i in postings[k]]),
+        _u64(raw_offsets), b"".join(raw),
+    ]
+
+    header = _HEADER.pack(MAGIC, version, int(time.time() * 1000), len(records), len(sections))
+    out = bytearray(header + bytes(_SECTION.size * len(sections)))
+    for k, data in enumerate(sections):
+        out += bytes(-len(out) % 8)
+        _SECTION.pack_into(out, _HEADER.size + k * _SECTION.size, len(out), len(data))
+        out += data
+    return bytes(out)
+
+
+class _StringTable:
+    """Sorted byte strings (an offsets array plus one blob), searched in place."""
+
+    def __init__(self, offsets: memoryview, blob: memoryview):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i: int) -> bytes:
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return bytes(self._blob[self._offsets[i]:self._offsets[i + 1]])
+
+    def find(self, key: bytes) -> int:
+        """Position of `key`, or -1."""
+        i = bisect_left(self, key)
+        return i if i < len(self) and self[i] == key else -1
+
+
+class JobSnapshot:
+    """A read-only view over one mapped snapshot file."""
+
+    def __init__(self, buf: memoryview, mm: Optional[mmap.mmap] = None):
+        magic, self.version, self.created_ms, self.count, nsections = _HEADER.unpack_from(buf, 0)
+        if magic != MAGIC or nsections != len(_SECTIONS):
+            raise ValueError("Not a job snapshot file")
+        toc = [_SECTION.unpack_from(buf, _HEADER.size + k * _SECTION.size) for k in range(nsections)]
+        if any(start + length > len(buf) for start, length in toc):
+            raise ValueError("Truncated job snapshot")
+        (offsets, self.body, url_offsets, url_keys, url_pos,
+         loc_offsets, loc_keys, post_offsets, postings, raw_offsets, _) = (buf[s:s + n] for s, n in toc)
+        self._offsets = offsets.cast("Q")
+        if len(self._offsets) != self.count + 1:
+            raise ValueError("Corrupt job snapshot offsets")
+        self._urls = _StringTable(url_offsets.cast("Q"), url_keys)
+        self._url_pos = url_pos.cast("I")
+        self._loc_keys = _StringTable(loc_offsets.cast("Q"), loc_keys)
+        self._post_offsets = post_offsets.cast("Q")
+        self._postings = postings.cast("I")
+        self._raw_offsets = raw_offsets.cast("Q")
+        # Substring search runs on the underlying mmap/bytes (both have
+        # find(sub, start, end)), bounded to the RAW section.
+        start, length = toc[-1]
+        self._raw = (buf.obj, start, start + length)
+        self._mm = mm  # keep the mapping alive as long as this view is
+
+    @classmethod
+    def empty(cls) -> "JobSnapshot":
+        return cls(memoryview(encode([], version=0)))
+
+    def bounds(self, offset: int = 0, limit: Optional[int] = None) -> Tuple[int, int]:
+        i = min(max(offset, 0), self.count)
+        j = self.count if limit is None else min(i + max(limit, 0), self.count)
+        return i, j
+
+    def records(self, offset: int = 0, limit: Optional[int] = None) -> memoryview:
+        """Comma-separated JSON objects for records [offset, offset+limit), no brackets."""
+        i, j = self.bounds(offset, limit)
+        if i == j:
+            return self.body[0:0]
+        return self.body[self._offsets[i]:self._offsets[j] - 1]
+
+    def record(self, i: int) -> memoryview:
+        return self.body[self._offsets[i]:self._offsets[i + 1] - 1]
+
+    def iter_ndjson(self, offset: int = 0, limit: Optional[int] = None, chunk: int = 1000) -> Iterator[bytes]:
+        """Records as NDJSON, `chunk` records per yielded block."""
+        i, j = self.bounds(offset, limit)
+        for start in range(i, j, chunk):
+            stop = min(start + chunk, j)
+            yield b"\n".join(self.record(k) for k in range(start, stop)) + b"\n"
+
+    def position(self, url: str) -> Optional[int]:
+        """Record position of a job URL, looked up in the mapped URL table."""
+        i = self._urls.find(url.encode())
+        return self._url_pos[i] if i >= 0 else None
+
+    def urls(self) -> Iterator[Tuple[str, int]]:
+        """(url, record position) pairs in URL order."""
+        for i in range(len(self._urls)):
+            yield self._urls[i].decode(), self._url_pos[i]
+
+    def postings(self, key: str) -> Sequence[int]:
+        """
+        Ascending record positions (i.e. newest first) carrying a location
+        index key: "city:<name>", "region:<code>", "country:<code>",
+        "workplace:<kind>" or "remote:1".
+        """
+        i = self._loc_keys.find(key.encode())
+        if i < 0:
+            return ()
+        return self._postings[self._post_offsets[i]:self._post_offsets[i + 1]]
+
+    def _substring(self, needle: str) -> List[int]:
+        """Positions whose lowercased raw location contains `needle`."""
+        if not needle:
+            return list(range(self.count))
+        sub = needle.encode()
+        if b"\0" in sub:
+            return []
+        src, start, end = self._raw
+        hits = []
+        p = src.find(sub, start, end)
+        while p >= 0:
+            i = bisect_right(self._raw_offsets, p - start) - 1
+            hits.append(i)
+            p = src.find(sub, start + self._raw_offsets[i + 1], end)
+        return hits
+
+    def filter(self, location: Optional[str] = None, remote: Optional[bool] = None) -> List[int]:
+        """Positions of records matching a location filter and/or remote flag."""
+        hits: Optional[set] = None
+        if location:
+            places = query_keys(location)
+            if places:
+                hits = set()
+                for keys in places:
+                    hits |= set.intersection(*(set(self.postings(k)) for k in keys))
+            else:
+                # Not something the gazetteer understands: fall back to a
+                # substring match on the raw strings.
+                hits = set(self._substring(location.strip().lower()))
+        if remote is not None:
+            remote_hits = set(self.postings("remote:1"))
+            if hits is None:
+                hits = set(range(self.count))
+            hits = hits & remote_hits if remote else hits - remote_hits
+        return sorted(hits) if hits is not None else list(range(self.count))
+
+    def jobs(self) -> List[Job]:
+        """Decoded records (for callers that need Python objects, not bytes)."""
+        return orjson.loads(self.body)
+
+
+def diff(old: JobSnapshot, new: JobSnapshot) -> Tuple[List[str], List[str], List[str]]:
+    """
+    (added, updated, removed) job URLs between two snapshots, by record bytes.
+    Both URL tables are sorted, so this is a single merge pass.
+    """
+    added, updated, removed = [], [], []
+    olds, news = old.urls(), new.urls()
+    o, n = next(olds, None), next(news, None)
+    while o is not None or n is not None:
+        if n is None or (o is not None and o[0] < n[0]):
+            removed.append(o[0])
+            o = next(olds, None)
+        elif o is None or n[0] < o[0]:
+            added.append(n[0])
+            n = next(news, None)
+        else:
+            if new.record(n[1]) != old.record(o[1]):
+                updated.append(n[0])
+            o, n = next(olds, None), next(news, None)
+    return added, updated, removed
+
+
+class SnapshotReader:
+    """
+    Per-process handle that swaps to the newest published snapshot.
+
+    current() costs one stat() in the common case; a new file (different
+    inode/mtime/size) is mapped once and replaces the old view atomically.
+    Old mappings are released when the last response using them finishes.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self._path = path
+        self._lock = threading.Lock()
+        self._stamp: Optional[Tuple[int, int, int]] = None
+        self._snap = JobSnapshot.empty()
+
+    @property
+    def path(self) -> str:
+        return self._path or snapshot_path()
+
+    def current(self) -> JobSnapshot:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return self._snap
+        stamp = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if stamp != self._stamp:
+            with self._lock:
+                if stamp != self._stamp:
+                    self._load(stamp)
+        return self._snap
+
+    def _load(self, stamp: Tuple[int, int, int]) -> None:
+        # The stamp is recorded even when loading fails, so a bad file is
+        # logged once and the previous snapshot keeps serving until the next
+        # publish replaces it.
+        self._stamp = stamp
+        try:
+            with open(self.path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            snap = JobSnapshot(memoryview(mm), mm)
+        except (OSError, ValueError, TypeError, struct.error) as e:
+            logger.error("Ignoring unreadable job snapshot %s: %s", self.path, e)
+            return
+        if snap.version >= self._snap.version:
+            self._snap = snap
+
+    def publish(self, jobs: Iterable[Job]) -> JobSnapshot:
+        """Write a new snapshot atomically and switch this reader to it."""
+        prev = self.current().version
+        version = max(prev + 1, int(time.time() * 1000))
+        data = encode(jobs, version)
+
+        path = self.path
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())  # the rename must never expose an unwritten file
+        os.replace(tmp, path)
+        return self.current()
+
+
+reader = SnapshotReader()
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import time
-from typing import Dict, List, Literal, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple
 
-import httpx
+if TYPE_CHECKING:  # annotations only; callers pass in their own client
+    import httpx
 
 Platform = Literal["lever", "greenhouse"]
 Job = Dict[str, object]
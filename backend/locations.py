@@ -0,0 +1,191 @@
+# backend/locations.py
+"""
+Location normalization for job postings.
+
+Turns free-text strings such as "San Francisco, CA / Remote (US)" or "n/a"
+into canonical (city, region, country) places plus remote/hybrid flags,
+using the offline gazetteer. Parsing is cached per raw string, since job
+feeds repeat the same handful of locations over and over.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from string import capwords
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from gazetteer import BLOCS, CITIES, COUNTRIES, PROVINCE_CODES, REGIONS
+from jobs_fetchers import Job
+
+# Segments: "A / B", "A; B", "A | B", "A (B)", "A - B", "A or B"
+# (" or " is case-sensitive so "Portland, OR" stays one segment.)
+# The delimiter is captured: "(" / "[" / " - " right after a remote segment
+# opens a qualifier ("Remote (US-only)", "Remote - EU").
+_SPLIT = re.compile(r"\s*([/;|•()\[\]\n]|\s[-–—]\s|(?-i:\sor\s))\s*", re.IGNORECASE)
+_QUALIFIER_OPEN = {"(", "[", "-", "–", "—"}
+_REMOTE = re.compile(
+    r"\b(?:remote|anywhere|distributed|work from home|wfh|telecommute|virtual)\b(?:[\s-]*(?:first|friendly|only|ok))?",
+    re.IGNORECASE,
+)
+_HYBRID = re.compile(r"\bhybrid\b", re.IGNORECASE)
+_NOISE = re.compile(
+    r"\b(?:on-?site|in[- ]office|office|hq|headquarters|flexible|based|only|location|locations)\b", re.IGNORECASE
+)
+_STRIP = " \t-–—,:.*"
+_UNKNOWN = {
+    "", "n/a", "na", "none", "tbd", "tba", "unknown", "various", "multiple", "multiple locations", *BLOCS,
+}
+
+
+class Place(NamedTuple):
+    city: Optional[str]
+    region: Optional[str]   # ISO 3166-2 style, e.g. "US-CA"
+    country: Optional[str]  # ISO 3166-1 alpha-2, e.g. "US"
+
+    def keys(self) -> List[str]:
+        """Index keys, most specific first."""
+        out = []
+        if self.city:
+            out.append(f"city:{self.city.lower()}")
+        if self.region:
+            out.append(f"region:{self.region}")
+        if self.country:
+            out.append(f"country:{self.country}")
+        return out
+
+
+class ParsedLocation(NamedTuple):
+    places: Tuple[Place, ...]
+    remote: bool
+    hybrid: bool
+
+    @property
+    def workplace(self) -> Optional[str]:
+        if self.hybrid:
+            return "hybrid"
+        if self.remote:
+            return "remote"
+        if self.places:
+            return "onsite"
+        return None
+
+
+def _place(text: str, qualifier: bool = False) -> Optional[Place]:
+    """
+    Parse one segment. A `qualifier` segment (inside or right after "Remote")
+    only narrows the remote scope, so unknown names there yield no place
+    instead of becoming a city ("Remote (UTC+1)").
+    """
+    parts = [p.strip(_STRIP) for p in text.split(",")]
+    parts = [p for p in parts if p and p.lower() not in BLOCS]
+    if not parts:
+        return None
+    low = [p.lower() for p in parts]
+
+    if len(low) == 1:
+        t = low[0]
+        if t in CITIES:
+            name, c, r = CITIES[t]
+            return Place(name, r, c)
+        if t in COUNTRIES:
+            return Place(None, None, COUNTRIES[t])
+        if t in REGIONS:
+            country, region = REGIONS[t]
+            return Place(None, region, country)
+        return None if qualifier else Place(capwords(parts[0]), None, None)
+
+    # "City, Region[, Country]" — trailing parts qualify the first one.
+    region = country = None
+    for t in reversed(low[1:]):
+        if country is None and t in COUNTRIES:
+            country = COUNTRIES[t]
+        elif region is None and (t in REGIONS or t in PROVINCE_CODES):
+            rc, region = REGIONS.get(t) or PROVINCE_CODES[t]
+            country = country or rc
+
+    head = low[0]
+    if head in CITIES:
+        name, c, r = CITIES[head]
+        if country is None and region is None:
+            return Place(name, r, c)
+        if c.lower() in low[1:]:
+            # "Pune, IN" is India, not Indiana: when the qualifier is also
+            # the known city's country code, trust the gazetteer.
+            return Place(name, r, c)
+        return Place(name, region, country)
+    if region is None and country is None:
+        # Neither side is known; don't guess which part is the city.
+        return None if qualifier else Place(capwords(parts[0]), None, None)
+    if head in REGIONS and region is None:
+        rc, region = REGIONS[head]
+        return Place(None, region, country or rc)
+    if head in COUNTRIES:
+        return Place(None, region, COUNTRIES[head])
+    return Place(capwords(parts[0]), region, country)
+
+
+def _parse(raw: str) -> ParsedLocation:
+    if raw.strip().lower() in _UNKNOWN:
+        return ParsedLocation((), False, False)
+    remote = hybrid = False
+    places: Dict[Place, None] = {}
+    pieces = _SPLIT.split(raw)
+    after_remote = False
+    for k in range(0, len(pieces), 2):
+        seg = pieces[k]
+        if not seg:
+            continue
+        delim = pieces[k - 1].strip() if k else ""
+        qualifier = after_remote and delim in _QUALIFIER_OPEN
+        after_remote = bool(_REMOTE.search(seg))
+        if after_remote:
+            remote = qualifier = True
+            seg = _REMOTE.sub(" ", seg)
+        if _HYBRID.search(seg):
+            hybrid = True
+            seg = _HYBRID.sub(" ", seg)
+        seg = _NOISE.sub(" ", seg).strip(_STRIP)
+        if not seg or seg.lower() in _UNKNOWN:
+            continue
+        place = _place(seg, qualifier)
+        if place is not None:
+            places[place] = None
+    return ParsedLocation(tuple(places), remote, hybrid)
+
+
+@lru_cache(maxsize=65536)
+def parse_location(raw: Optional[str]) -> ParsedLocation:
+    """Parse a raw location string (cached per distinct string)."""
+    return _parse(raw or "")
+
+
+def normalize_job(job: Job) -> Job:
+    """Annotate a fetched job with `locations`, `workplace` and `remote`."""
+    parsed = parse_location(str(job.get("location") or ""))
+    job["locations"] = [p._asdict() for p in parsed.places]
+    job["workplace"] = parsed.workplace
+    job["remote"] = None if parsed.workplace is None else parsed.remote
+    return job
+
+
+def normalize_jobs(jobs: Iterable[Job]) -> List[Job]:
+    return [normalize_job(j) for j in jobs]
+
+
+def index_keys(job: Job) -> List[str]:
+    """Keys a stored (already normalized) job is indexed under."""
+    keys = [k for loc in job.get("locations") or () for k in Place(**loc).keys()]
+    if job.get("workplace"):
+        keys.append(f"workplace:{job['workplace']}")
+    if job.get("remote"):
+        keys.append("remote:1")
+    return keys
+
+
+def query_keys(text: str) -> List[List[str]]:
+    """
+    Index keys per place in a user's location filter. A job matches a place
+    when it carries all of that place's keys ("Cambridge, UK" needs both
+    city:cambridge and country:GB), and matches the filter on any place.
+    """
+    return [p.keys() for p in parse_location(text).places if p.keys()]
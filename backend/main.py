@@ -1,15 +1,43 @@
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import Response
-from dotenv import load_dotenv
+from contextlib import asynccontextmanager
 
-from routers import ai, applications, analytics, interview, jobs
-from db import init_db
+from startup import report
 
-load_dotenv()
-init_db()
+with report.phase("import_fastapi"):
+    from fastapi import FastAPI, Request
+    from fastapi.middleware.cors import CORSMiddleware
+    from fastapi.responses import Response
+    from serialization import ORJSONResponse
 
-app = FastAPI(title="AI Job Coach API")
+with report.phase("import_routers"):
+    # Routers keep heavy SDKs (OpenAI, httpx) behind first use.
+    from routers import ai, applications, analytics, events, interview, jobs
+    from rate_limit import RateLimitExceeded, rate_limit_handler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    with report.phase("load_dotenv"):
+        from dotenv import load_dotenv
+        load_dotenv()
+    with report.phase("db_check"):
+        from db import init_db
+        init_db()
+    with report.phase("stores"):
+        # Open the shared stores now so a bad RATE_LIMIT_STORAGE /
+        # EVENTS_STORAGE (e.g. redis:// without the package) fails the boot
+        # instead of every request.
+        from events import bus
+        from rate_limit import limiter
+        if limiter.enabled:
+            limiter.store
+        bus.backend
+    report.log()
+    app.state.startup_report = report
+    yield
+
+
+app = FastAPI(title="AI Job Coach API", lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_exception_handler(RateLimitExceeded, rate_limit_handler)
 
 app.add_middleware(
     CORSMiddleware,
@@ -32,4 +60,10 @@ app.include_router(applications.router)
 app.include_router(analytics.router)
 app.include_router(interview.router)
 app.include_router(jobs.router)
+app.include_router(events.router)
+
 
+@app.get("/health/startup", include_in_schema=False)
+def startup_report():
+    """Where boot time went: per-phase timings from the last cold start."""
+    return report.as_dict()
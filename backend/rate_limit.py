@@ -1,16 +1,297 @@
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+# backend/rate_limit.py
+"""
+Cost-weighted GCRA rate limiter.
+
+GCRA (generic cell rate algorithm) keeps a single float per client — the
+"theoretical arrival time" (TAT) — so memory is O(1) per key no matter how
+large the burst window is. Each request spends `cost` units; a client may
+spend up to RATE_LIMIT_BURST units at once and regains RATE_LIMIT_PER_MINUTE
+units per minute.
+
+Storage is picked from RATE_LIMIT_STORAGE:
+  - "memory"               per-process dict (single worker / dev)
+  - "sqlite:///path.db"    shared by all uvicorn workers on one host (default)
+  - "redis://host:6379/0"  shared across hosts (needs the `redis` package)
+
+Buckets are keyed on the client IP. Behind a reverse proxy every request
+arrives from the proxy, so list its addresses in RATE_LIMIT_TRUSTED_PROXIES
+(comma-separated IPs/CIDRs, default 127.0.0.1) and the client is taken from
+X-Forwarded-For instead.
+"""
+from __future__ import annotations
+
+import ipaddress
+import itertools
+import math
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Protocol, Tuple
+
+from fastapi import HTTPException, Request
 from fastapi.responses import JSONResponse
 
-limiter = Limiter(key_func=get_remote_address)
+DEFAULT_STORAGE = "sqlite:///./ratelimit.db"
+DEFAULT_TRUSTED_PROXIES = "127.0.0.1"
+
+# Per-route weights: cheap reads cost 1, anything that burns CPU, outbound
+# HTTP or LLM tokens costs more.
+COST_READ = 1
+COST_AI = 5
+COST_REFRESH = 15
+COST_LLM = 10
+
+
+class RateLimitExceeded(HTTPException):
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(
+            status_code=429,
+            detail="Rate limit exceeded. Please wait a minute and try again.",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+        )
+
+
+# --------- Stores ---------
+
+class Store(Protocol):
+    def hit(self, key: str, cost: float, interval: float, capacity: float) -> Tuple[bool, float]:
+        """Atomically apply a GCRA step. Returns (allowed, retry_after_seconds)."""
+        ...
+
+
+def _gcra(tat: Optional[float], now: float, cost: float, interval: float, capacity: float) -> Tuple[bool, float, float]:
+    """Pure GCRA step. Returns (allowed, retry_after, new_tat)."""
+    base = max(tat or now, now)
+    new_tat = base + cost * interval
+    limit = capacity * interval
+    if new_tat - now <= limit:
+        return True, 0.0, new_tat
+    return False, new_tat - limit - now, base
+
+
+class MemoryStore:
+    """Per-process store. Stale keys (TAT in the past) are pruned as the table grows."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self._tat: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._max_keys = max_keys
+
+    def hit(self, key: str, cost: float, interval: float, capacity: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            allowed, retry, new_tat = _gcra(self._tat.get(key), now, cost, interval, capacity)
+            if allowed:
+                if len(self._tat) >= self._max_keys and key not in self._tat:
+                    self._prune(now)
+                self._tat[key] = new_tat
+        return allowed, retry
+
+    def _prune(self, now: float) -> None:
+        # A TAT in the past carries no state — the client is back at full burst.
+        self._tat = {k: v for k, v in self._tat.items() if v > now}
+
+
+class SQLiteStore:
+    """
+    Host-local store shared across uvicorn workers through a small WAL-mode
+    SQLite file. BEGIN IMMEDIATE serializes the read-modify-write per call.
+    Rows whose TAT has passed carry no state and are trimmed every
+    PRUNE_EVERY hits so the file doesn't grow by one row per client forever.
+    """
+
+    PRUNE_EVERY = 100
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._hits = itertools.count(1)
+        with self._conn() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS rate_limit (key TEXT PRIMARY KEY, tat REAL NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=OFF")  # limiter state is disposable
+            self._local.conn = conn
+        return conn
+
+    def hit(self, key: str, cost: float, interval: float, capacity: float) -> Tuple[bool, float]:
+        conn = self._conn()
+        now = time.time()  # wall clock: shared across processes
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tat FROM rate_limit WHERE key = ?", (key,)).fetchone()
+            allowed, retry, new_tat = _gcra(row[0] if row else None, now, cost, interval, capacity)
+            if allowed:
+                conn.execute(
+                    "INSERT INTO rate_limit (key, tat) VALUES (?, ?) "
+                    "ON CONFLICT(key) DO UPDATE SET tat = excluded.tat",
+                    (key, new_tat),
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if next(self._hits) % self.PRUNE_EVERY == 0:
+            conn.execute("DELETE FROM rate_limit WHERE tat < ?", (now,))
+        return allowed, retry
+
+
+# Runs server-side so the read-modify-write is atomic and uses one clock.
+_REDIS_GCRA = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) + tonumber(t[2]) / 1000000
+local cost = tonumber(ARGV[1])
+local interval = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3]) * interval
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then tat = now end
+local new_tat = tat + cost * interval
+if new_tat - now <= limit then
+  redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil((new_tat - now) * 1000) + 1)
+  return {1, '0'}
+end
+return {0, tostring(new_tat - limit - now)}
+"""
+
+
+class RedisStore:
+    """Cross-host store; keys expire once they carry no state."""
+
+    def __init__(self, url: str, prefix: str = "rl:"):
+        try:
+            import redis  # optional dependency, only needed in production
+        except ImportError:
+            raise RuntimeError("RATE_LIMIT_STORAGE is a Redis URL but the `redis` package is not installed") from None
+
+        self._client = redis.Redis.from_url(url)
+        self._script = self._client.register_script(_REDIS_GCRA)
+        self._prefix = prefix
+
+    def hit(self, key: str, cost: float, interval: float, capacity: float) -> Tuple[bool, float]:
+        allowed, retry = self._script(keys=[self._prefix + key], args=[cost, interval, capacity])
+        return bool(allowed), float(retry)
+
+
+def make_store(url: str) -> Store:
+    if url == "memory":
+        return MemoryStore()
+    if url.startswith("sqlite:///"):
+        return SQLiteStore(url[len("sqlite:///"):])
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStore(url)
+    raise ValueError(f"Unsupported RATE_LIMIT_STORAGE: {url!r}")
+
+
+# --------- Limiter ---------
+
+@lru_cache(maxsize=8)
+def _networks(raw: str) -> Tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...]:
+    return tuple(ipaddress.ip_network(p.strip(), strict=False) for p in raw.split(",") if p.strip())
+
+
+def _trusted(host: str, networks) -> bool:
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(ip in net for net in networks)
+
+
+def get_remote_address(request: Request) -> str:
+    """
+    Client IP for bucketing. When the peer is a trusted proxy, walk
+    X-Forwarded-For right to left and take the first hop that isn't one of
+    ours: entries further left are client-supplied and could be spoofed.
+    """
+    host = request.client.host if request.client else "unknown"
+    networks = _networks(os.getenv("RATE_LIMIT_TRUSTED_PROXIES", DEFAULT_TRUSTED_PROXIES))
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded or not _trusted(host, networks):
+        return host
+    for hop in reversed([h.strip() for h in forwarded.split(",") if h.strip()]):
+        host = hop
+        if not _trusted(hop, networks):
+            break
+    return host
+
+
+class Limiter:
+    def __init__(
+        self,
+        key_func: Callable[[Request], str] = get_remote_address,
+        per_minute: Optional[float] = None,
+        burst: Optional[float] = None,
+        storage: Optional[str] = None,
+    ):
+        self.key_func = key_func
+        self._per_minute = per_minute
+        self._burst = burst
+        self._storage = storage
+        self._store: Optional[Store] = None
+        self._lock = threading.Lock()
+
+    # Settings are read lazily so .env (loaded in the app lifespan) applies.
+    @property
+    def interval(self) -> float:
+        per_minute = self._per_minute or float(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
+        return 60.0 / per_minute
+
+    @property
+    def capacity(self) -> float:
+        return self._burst or float(os.getenv("RATE_LIMIT_BURST", "30"))
+
+    @property
+    def enabled(self) -> bool:
+        return os.getenv("RATE_LIMIT_ENABLED", "1").lower() not in {"0", "false", "no"}
+
+    @property
+    def store(self) -> Store:
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = make_store(self._storage or os.getenv("RATE_LIMIT_STORAGE", DEFAULT_STORAGE))
+        return self._store
+
+    def hit(self, key: str, cost: float = COST_READ) -> None:
+        allowed, retry = self.store.hit(key, cost, self.interval, self.capacity)
+        if not allowed:
+            raise RateLimitExceeded(retry)
+
+    def cost(self, cost: float) -> Callable[[Request], None]:
+        """FastAPI dependency charging `cost` units to the caller's bucket."""
+        # Sync on purpose: FastAPI runs it in the threadpool, so a SQLite
+        # lock wait or a Redis round trip never blocks the event loop.
+        def _dependency(request: Request) -> None:
+            if self.enabled:
+                self.hit(self.key_func(request), cost)
+        return _dependency
+
+
+limiter = Limiter()
+
 
 def rate_limit_handler(request, exc: RateLimitExceeded):
     return JSONResponse(
         status_code=429,
-        content={"detail": "Rate limit exceeded. Please wait a minute and try again."},
+        content={"detail": exc.detail},
+        headers=exc.headers,
     )
 
-__all__ = ["limiter", "rate_limit_handler", "SlowAPIMiddleware"]
 
+__all__ = [
+    "COST_AI",
+    "COST_LLM",
+    "COST_READ",
+    "COST_REFRESH",
+    "Limiter",
+    "RateLimitExceeded",
+    "limiter",
+    "rate_limit_handler",
+]
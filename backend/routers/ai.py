@@ -1,12 +1,12 @@
 # backend/routers/ai.py
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from typing import Literal, Optional
 
-from rate_limit import limiter
+from rate_limit import COST_AI, limiter
 from ai.job_tools import generate_cover_letter, tailor_resume
 
-router = APIRouter(prefix="/ai", tags=["ai"])
+router = APIRouter(prefix="/ai", tags=["ai"], dependencies=[Depends(limiter.cost(COST_AI))])
 
 # --------- Models ---------
 
@@ -1,19 +1,44 @@
-from fastapi import APIRouter, HTTPException
-from sqlmodel import select
-from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select as sa_select
+from typing import Iterator, List, Optional
 
 from db import get_session
+from events import bus
 from models import Application
+from rate_limit import COST_READ, limiter
+from serialization import CHUNK_ROWS, Format, rows_response
 
-router = APIRouter(prefix="/applications", tags=["applications"])
+router = APIRouter(prefix="/applications", tags=["applications"], dependencies=[Depends(limiter.cost(COST_READ))])
+
+
+def _iter_app_rows(ids: Optional[List[int]] = None) -> Iterator[dict]:
+    """
+    Plain column dicts straight from the cursor: no ORM identity map and no
+    Pydantic round-trip. The session stays open until the stream is drained.
+    """
+    with get_session() as session:
+        stmt = sa_select(Application.__table__)
+        if ids is not None:
+            stmt = stmt.where(Application.__table__.c.id.in_(ids))
+        result = session.execute(stmt.execution_options(yield_per=CHUNK_ROWS))
+        keys = list(result.keys())
+        for row in result:
+            yield dict(zip(keys, row))
 
 
 @router.get("/", response_model=List[Application])
-def list_apps():
+def list_apps(
+    format: Format = "json",
+    ids: Optional[str] = Query(None, description="Comma-separated IDs, e.g. from a change-feed delta"),
+):
+    # Rows come from our own table, so they skip response_model revalidation;
+    # response_model stays for the OpenAPI schema.
     try:
-        with get_session() as session:
-            rows = session.exec(select(Application)).all()
-            return rows
+        id_list = [int(i) for i in ids.split(",") if i.strip()] if ids is not None else None
+    except ValueError:
+        raise HTTPException(status_code=422, detail="ids must be comma-separated integers")
+    try:
+        return rows_response(_iter_app_rows(id_list), format)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to list applications: {e}")
 
@@ -25,7 +50,8 @@ def create_app(app: Application):
             session.add(app)
             session.commit()
             session.refresh(app)
-            return app
+        bus.notify("applications", added=[app.id])
+        return app
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to create application: {e}")
 
@@ -42,7 +68,8 @@ def update_app(app_id: int, patch: dict):
             session.add(obj)
             session.commit()
             session.refresh(obj)
-            return obj
+        bus.notify("applications", updated=[obj.id])
+        return obj
     except HTTPException:
         raise
     except Exception as e:
@@ -58,7 +85,7 @@ def delete_app(app_id: int):
                 raise HTTPException(status_code=404, detail="Application not found")
             session.delete(obj)
             session.commit()
-            return
+        bus.notify("applications", removed=[app_id])
     except HTTPException:
         raise
     except Exception as e:
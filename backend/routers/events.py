@@ -0,0 +1,91 @@
+# backend/routers/events.py
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import AsyncIterator, Optional, Set
+
+from events import RETAIN, bus
+from rate_limit import COST_READ, limiter
+from serialization import dumps
+
+router = APIRouter(prefix="/events", tags=["events"], dependencies=[Depends(limiter.cost(COST_READ))])
+
+HEARTBEAT_SECONDS = 15.0
+
+
+def _topics(raw: Optional[str]) -> Optional[Set[str]]:
+    return {t.strip() for t in raw.split(",") if t.strip()} if raw else None
+
+
+def _resume_from(cursor: Optional[int]) -> tuple[int, bool]:
+    """
+    Returns (cursor, reset). `reset` means the client's cursor is older than
+    what we retain (or it has none): it should refetch the full lists once.
+    """
+    head = bus.head()
+    if cursor is None or cursor > head:
+        return head, True
+    oldest = bus.oldest()
+    if oldest and cursor < oldest - 1:
+        return head, True
+    return cursor, False
+
+
+def _sse(event: str, data: dict, id: Optional[int] = None) -> bytes:
+    head = f"id: {id}\n" if id is not None else ""
+    return f"{head}event: {event}\n".encode() + b"data: " + dumps(data) + b"\n\n"
+
+
+@router.get("")
+async def stream(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0),
+    topics: Optional[str] = Query(None, description="Comma-separated, e.g. jobs,applications"),
+    last_event_id: Optional[str] = Header(None),
+):
+    """
+    Server-sent change feed. Each message is `event: <topic>` with
+    {"version", "added", "updated", "removed"} and `id: <version>`, so
+    EventSource reconnects resume via Last-Event-ID automatically.
+    """
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+    wanted = _topics(topics)
+
+    async def _gen() -> AsyncIterator[bytes]:
+        # Backend reads block (SQLite/Redis), so they go to the threadpool.
+        cursor, reset = await run_in_threadpool(_resume_from, since)
+        yield b"retry: 3000\n\n"
+        yield _sse("reset" if reset else "hello", {"version": cursor}, id=cursor)
+        while not await request.is_disconnected():
+            events = await run_in_threadpool(bus.since, cursor)
+            for e in events:
+                cursor = e["version"]
+                if wanted is None or e["topic"] in wanted:
+                    yield _sse(e["topic"], e, id=cursor)
+            if len(events) < RETAIN and not await bus.wait(cursor, HEARTBEAT_SECONDS):
+                yield b": keep-alive\n\n"
+
+    return StreamingResponse(
+        _gen(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/changes")
+def changes(
+    since: Optional[int] = Query(None, ge=0),
+    topics: Optional[str] = Query(None),
+):
+    """Pull variant of the feed: everything after `since`, plus the new cursor."""
+    cursor, reset = _resume_from(since)
+    wanted = _topics(topics)
+    events = [] if reset else bus.since(cursor)
+    if events:
+        cursor = events[-1]["version"]
+    return {
+        "version": cursor,
+        "reset": reset,
+        "events": [e for e in events if wanted is None or e["topic"] in wanted],
+    }
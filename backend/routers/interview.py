@@ -1,9 +1,13 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from typing import List, Literal, Optional
+from typing import TYPE_CHECKING, Annotated, List, Literal, Optional
 import os
-import httpx
-from openai import OpenAI
+
+from ai.job_tools import extract_job_keywords, generate_interview_questions, score_answers
+from rate_limit import COST_AI, COST_LLM, limiter
+
+if TYPE_CHECKING:  # the SDK is heavy; only import it once the coach is used
+    from openai import OpenAI
 
 router = APIRouter(prefix="/interview", tags=["interview"])
 
@@ -24,12 +28,15 @@ class CoachResponse(BaseModel):
 
 # --------- OpenAI client ---------
 
-def _get_openai_client() -> Optional[OpenAI]:
+def _get_openai_client() -> Optional["OpenAI"]:
     key = os.getenv("OPENAI_API_KEY", "").strip()
     if not key:
         return None
+    from openai import OpenAI
+
     # The SDK reads OPENAI_API_KEY automatically, but we construct explicitly for clarity.
-    return OpenAI(api_key=key)
+    # Short timeout so the UI stays snappy even if the API hiccups.
+    return OpenAI(api_key=key, timeout=15.0)
 
 
 SYSTEM_PROMPT = (
@@ -61,15 +68,13 @@ async def _ask_gpt(message: str, history: Optional[List[Msg]]) -> str:
             messages.append({"role": m.role, "content": m.content})
     messages.append({"role": "user", "content": message})
 
-    # Use a short timeout so the UI stays snappy even if the API hiccups
     try:
-        with httpx.Client(timeout=15.0) as _:
-            resp = client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=messages,
-                temperature=0.5,
-                max_tokens=500,
-            )
+        resp = client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=messages,
+            temperature=0.5,
+            max_tokens=500,
+        )
         content = resp.choices[0].message.content or ""
         return content.strip()
     except Exception as e:
@@ -79,7 +84,7 @@ async def _ask_gpt(message: str, history: Optional[List[Msg]]) -> str:
 
 # --------- Route ----------
 
-@router.post("/coach", response_model=CoachResponse)
+@router.post("/coach", response_model=CoachResponse, dependencies=[Depends(limiter.cost(COST_LLM))])
 async def coach(req: CoachRequest) -> CoachResponse:
     """
     Accepts:
@@ -96,6 +101,63 @@ async def coach(req: CoachRequest) -> CoachResponse:
     return CoachResponse(reply=reply)
 
 
+# --------- Questions & batch scoring ---------
+
+class QuestionsRequest(BaseModel):
+    job_description: str = Field(min_length=1, max_length=20000)
+    seniority: Optional[Literal["entry", "mid", "senior"]] = "entry"
+
+class QuestionsResponse(BaseModel):
+    questions: List[str]
+    keywords: List[str]
+
+class ScoredAnswer(BaseModel):
+    question: str = Field(max_length=2000)
+    answer: str = Field(max_length=20000)
 
+class ScoreRequest(BaseModel):
+    # Either pass the job description (keywords are extracted the same way the
+    # questions were) or an explicit keyword list.
+    job_description: Optional[str] = Field(default=None, max_length=20000)
+    # Bounded per item and in count: each keyword becomes automaton states.
+    keywords: Optional[List[Annotated[str, Field(max_length=100)]]] = Field(default=None, max_length=500)
+    answers: List[ScoredAnswer] = Field(min_length=1, max_length=200)
 
+class AnswerScore(BaseModel):
+    score: float
+    feedback: str
+    tips: List[str]
 
+class ScoreResponse(BaseModel):
+    results: List[AnswerScore]
+    average: float
+
+
+@router.post("/questions", response_model=QuestionsResponse, dependencies=[Depends(limiter.cost(COST_AI))])
+def questions(req: QuestionsRequest) -> QuestionsResponse:
+    try:
+        return QuestionsResponse(
+            questions=generate_interview_questions(req.job_description, req.seniority or "entry"),
+            keywords=extract_job_keywords(req.job_description),
+        )
+    except Exception:
+        raise HTTPException(status_code=500, detail="Failed to generate interview questions.")
+
+
+@router.post("/score", response_model=ScoreResponse, dependencies=[Depends(limiter.cost(COST_AI))])
+def score(req: ScoreRequest) -> ScoreResponse:
+    """Score every answer of a mock interview session in one call."""
+    if req.keywords is not None:
+        keywords = req.keywords
+    elif req.job_description:
+        keywords = extract_job_keywords(req.job_description)
+    else:
+        keywords = []
+    try:
+        results = score_answers(
+            [(a.question, a.answer) for a in req.answers], keywords, cache=req.keywords is None
+        )
+    except Exception:
+        raise HTTPException(status_code=500, detail="Failed to score answers.")
+    average = sum(r["score"] for r in results) / len(results)
+    return ScoreResponse(results=results, average=round(average, 2))
@@ -1,7 +1,14 @@
-from fastapi import APIRouter, HTTPException
-import httpx
+from fastapi import APIRouter, Depends, HTTPException, Query
+from pydantic import BaseModel, Field
+from fastapi.responses import Response, StreamingResponse
+from typing import List, Optional
 import asyncio
 from jobs_fetchers import fetch_for_slug, Job
+from events import bus
+from job_snapshot import diff, reader
+from locations import normalize_jobs
+from rate_limit import COST_READ, COST_REFRESH, limiter
+from serialization import NDJSON_MEDIA_TYPE, Format
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
@@ -20,17 +27,60 @@ COMPANY_SLUGS = [
     "discord",        # Greenhouse
 ]
 
-# In-memory cache for quick reads (could be DB in production)
-JOBS_CACHE: list[Job] = []
 
-@router.get("")
-def list_jobs() -> list[Job]:
-    """Return cached jobs, newest first."""
-    return sorted(JOBS_CACHE, key=lambda j: int(j.get("ts") or 0), reverse=True)
+class SnapshotResponse(Response):
+    """
+    Sends "[", a slice of the mapped snapshot, then "]" as separate body
+    chunks, so the records go out straight from the mmap without a copy.
+    """
+    media_type = "application/json"
 
-@router.post("/refresh")
+    def __init__(self, records: memoryview, version: int):
+        self.records = records
+        super().__init__(content=b"", headers={"X-Jobs-Version": str(version)})
+        self.headers["content-length"] = str(len(records) + 2)
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await send({"type": "http.response.body", "body": b"[", "more_body": True})
+        await send({"type": "http.response.body", "body": self.records, "more_body": True})
+        await send({"type": "http.response.body", "body": b"]"})
+
+
+@router.get("", dependencies=[Depends(limiter.cost(COST_READ))])
+def list_jobs(
+    offset: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=0),
+    format: Format = "json",
+    location: Optional[str] = Query(None, max_length=200, description='e.g. "San Francisco", "CA", "Canada"'),
+    remote: Optional[bool] = None,
+) -> list[Job]:
+    """Return jobs from the shared snapshot, newest first (already sorted on publish)."""
+    snap = reader.current()
+    if location or remote is not None:
+        # Filters resolve through the snapshot's location index, then we
+        # page over the matching positions.
+        hits = snap.filter(location, remote)[offset:]
+        if limit is not None:
+            hits = hits[:limit]
+        if format == "ndjson":
+            body = b"".join(bytes(snap.record(i)) + b"\n" for i in hits)
+            return Response(content=body, media_type=NDJSON_MEDIA_TYPE, headers={"X-Jobs-Version": str(snap.version)})
+        body = b"[" + b",".join(snap.record(i) for i in hits) + b"]"
+        return Response(content=body, media_type="application/json", headers={"X-Jobs-Version": str(snap.version)})
+    if format == "ndjson":
+        return StreamingResponse(
+            snap.iter_ndjson(offset, limit),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={"X-Jobs-Version": str(snap.version)},
+        )
+    return SnapshotResponse(snap.records(offset, limit), snap.version)
+
+@router.post("/refresh", dependencies=[Depends(limiter.cost(COST_REFRESH))])
 def refresh_jobs():
     """Refresh job listings from all company slugs."""
+    import httpx  # deferred: only refreshing workers need the HTTP client
+
     async def _run():
         jobs: list[Job] = []
         async with httpx.AsyncClient(follow_redirects=True) as client:
@@ -43,14 +93,25 @@ def refresh_jobs():
         return jobs
 
     try:
-        new_jobs = asyncio.run(_run())
-        global JOBS_CACHE
-        JOBS_CACHE = new_jobs
-        return {"ok": True, "count": len(JOBS_CACHE)}
+        new_jobs = normalize_jobs(asyncio.run(_run()))
+        old = reader.current()
+        snap = reader.publish(new_jobs)
+        added, updated, removed = diff(old, snap)
+        if added or updated or removed:
+            bus.notify("jobs", added=added, updated=updated, removed=removed, snapshot=snap.version)
+        return {"ok": True, "count": snap.count, "version": snap.version}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Refresh failed: {e}")
 
 
+class LookupRequest(BaseModel):
+    urls: List[str] = Field(max_length=5000)
 
-
+@router.post("/lookup", dependencies=[Depends(limiter.cost(COST_READ))])
+def lookup_jobs(req: LookupRequest) -> list[Job]:
+    """Fetch specific jobs by URL, e.g. the IDs from a change-feed delta."""
+    snap = reader.current()
+    positions = (snap.position(u) for u in req.urls)
+    hits = [snap.record(i) for i in positions if i is not None]
+    return Response(content=b"[" + b",".join(hits) + b"]", media_type="application/json")
 
@@ -0,0 +1,71 @@
+# backend/serialization.py
+"""
+Fast JSON output for list endpoints.
+
+- ORJSONResponse is the app-wide default response class.
+- `rows_response` serializes trusted DB rows straight to JSON bytes with
+  orjson (no response_model revalidation) and, past one chunk, streams them
+  as a chunked JSON array or NDJSON instead of building the body in memory.
+"""
+from __future__ import annotations
+
+from itertools import islice
+from typing import Iterable, Iterator, Literal, Mapping, Optional
+
+import orjson
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+
+Format = Literal["json", "ndjson"]
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CHUNK_ROWS = 1000
+_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+def dumps(obj) -> bytes:
+    return orjson.dumps(obj, option=_OPTS)
+
+
+def _encode_chunk(rows: Iterable[Mapping], fmt: Format, first: bool) -> bytes:
+    if fmt == "ndjson":
+        return b"".join(orjson.dumps(r, option=_OPTS) + b"\n" for r in rows)
+    body = b",".join(orjson.dumps(r, option=_OPTS) for r in rows)
+    if not body or first:
+        return body
+    return b"," + body
+
+
+def rows_response(
+    rows: Iterable[Mapping],
+    fmt: Format = "json",
+    chunk_rows: int = CHUNK_ROWS,
+    headers: Optional[Mapping[str, str]] = None,
+) -> Response:
+    """
+    Serialize plain dict rows. The first chunk is encoded eagerly so errors
+    surface before headers go out; if everything fits in it we send a regular
+    response with Content-Length, otherwise the rest is streamed.
+    """
+    it = iter(rows)
+    head = list(islice(it, chunk_rows))
+    media_type = NDJSON_MEDIA_TYPE if fmt == "ndjson" else "application/json"
+    first = _encode_chunk(head, fmt, first=True)
+
+    if len(head) < chunk_rows:
+        body = first if fmt == "ndjson" else b"[" + first + b"]"
+        return Response(content=body, media_type=media_type, headers=headers)
+
+    def _stream() -> Iterator[bytes]:
+        yield first if fmt == "ndjson" else b"[" + first
+        while True:
+            chunk = list(islice(it, chunk_rows))
+            if not chunk:
+                break
+            yield _encode_chunk(chunk, fmt, first=False)
+        if fmt != "ndjson":
+            yield b"]"
+
+    return StreamingResponse(_stream(), media_type=media_type, headers=headers)
+
+
+__all__ = ["CHUNK_ROWS", "Format", "NDJSON_MEDIA_TYPE", "ORJSONResponse", "dumps", "rows_response"]
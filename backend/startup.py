@@ -0,0 +1,49 @@
+# backend/startup.py
+"""
+Boot-time bookkeeping: records how long each startup phase takes so cold
+starts can be broken down (imports vs. env loading vs. DB check, etc.).
+"""
+from __future__ import annotations
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger("uvicorn.error")
+
+# Process start reference point; this module is imported first by main.py.
+_T0 = time.perf_counter()
+
+
+class StartupReport:
+    def __init__(self) -> None:
+        self.phases: List[Tuple[str, float]] = []
+        self.boot: Optional[float] = None  # frozen by log() once startup is done
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def total(self) -> float:
+        """Seconds from first import to the end of startup (or to now, while booting)."""
+        return self.boot if self.boot is not None else time.perf_counter() - _T0
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "phases_ms": {name: round(sec * 1000, 2) for name, sec in self.phases},
+            "boot_ms": round(self.total() * 1000, 2),
+        }
+
+    def log(self) -> None:
+        """Freeze the boot time and log the breakdown; called when the lifespan finishes startup."""
+        self.boot = self.total()
+        parts = ", ".join(f"{name}={sec * 1000:.1f}ms" for name, sec in self.phases)
+        logger.info("Startup: %s (%.1fms since first import)", parts, self.boot * 1000)
+
+
+report = StartupReport()
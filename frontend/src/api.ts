@@ -62,6 +62,13 @@ export type AnalyticsOverview = {
 };
 
 
+export type AnswerScore = {
+  score: number;
+  feedback: string;
+  tips: string[];
+};
+
+
 // ---- API ----
 export const api = {
   // Generator (note /ai prefix)
@@ -100,8 +107,28 @@ export const api = {
     }),
 
 
+  // Mock interview: questions for a JD, then score the whole session at once
+  interviewQuestions: (payload: { job_description: string; seniority?: "entry" | "mid" | "senior" }) =>
+    request<{ questions: string[]; keywords: string[] }>("/interview/questions", {
+      method: "POST",
+      json: payload,
+    }),
+
+  scoreAnswers: (payload: {
+    job_description?: string;
+    keywords?: string[];
+    answers: { question: string; answer: string }[];
+  }) =>
+    request<{ results: AnswerScore[]; average: number }>("/interview/score", {
+      method: "POST",
+      json: payload,
+    }),
+
+
   // Applications
   listApplications: () => request<Application[]>("/applications"),
+  // Only the given rows, e.g. the IDs from a change-feed delta
+  getApplications: (ids: number[]) => request<Application[]>(`/applications?ids=${ids.join(",")}`),
   createApplication: (app: Omit<Application, "id">) =>
     request<Application>("/applications", { method: "POST", json: app }),
   updateApplication: (id: number, app: Partial<Application>) =>
@@ -130,6 +157,10 @@ export const api = {
     ),
 
   refreshJobs: () => request<{ added: number; total: number }>(`/jobs/refresh`, { method: "POST" }),
+
+  // Specific jobs by URL (the IDs used in "jobs" change events)
+  lookupJobs: <T = JobPosting>(urls: string[]) =>
+    request<T[]>(`/jobs/lookup`, { method: "POST", json: { urls } }),
   
 };
 
@@ -143,8 +174,39 @@ export type JobPosting = {
   location?: string | null;
   url: string;
   remote?: boolean | null;
+  workplace?: "remote" | "hybrid" | "onsite" | null;
+  locations?: { city: string | null; region: string | null; country: string | null }[];
   posted_at?: string | null;
   created_at: string;
 };
 
 
+// ---- Change feed (SSE) ----
+export type ChangeEvent<Id = string | number> = {
+  version: number;
+  topic: string;
+  added: Id[];
+  updated: Id[];
+  removed: Id[];
+};
+
+/**
+ * Subscribe to /events for the given topics. EventSource reconnects on its
+ * own and resumes from Last-Event-ID; `onReset` fires when the server can't
+ * resume (first connect, or the cursor fell out of its retention window) and
+ * the caller should reload the full list. Returns an unsubscribe function.
+ */
+export function subscribeChanges(
+  topics: string[],
+  onEvent: (e: ChangeEvent) => void,
+  onReset?: (version: number) => void
+): () => void {
+  const es = new EventSource(join(BASE_URL, `/events?topics=${encodeURIComponent(topics.join(","))}`));
+  for (const t of topics) {
+    es.addEventListener(t, (m) => onEvent(JSON.parse((m as MessageEvent).data)));
+  }
+  if (onReset) {
+    es.addEventListener("reset", (m) => onReset(JSON.parse((m as MessageEvent).data).version));
+  }
+  return () => es.close();
+}
@@ -1,6 +1,6 @@
 //
 import { useEffect, useState } from "react";
-import { api } from "../api";
+import { api, subscribeChanges } from "../api";
 import type { AnalyticsOverview } from "../api";
 
 function Bar({ label, value, max }: { label: string; value: number; max: number }) {
@@ -35,6 +35,8 @@ export default function AnalyticsPage() {
 
   useEffect(() => {
     refresh();
+    // Recompute only when an application actually changes, instead of polling.
+    return subscribeChanges(["applications"], () => refresh());
   }, []);
 
   const maxByStatus = data ? Math.max(1, ...Object.values(data.by_status)) : 1;
@@ -1,5 +1,5 @@
 import { useEffect, useState } from "react";
-import { api, type Application } from "../api";
+import { api, subscribeChanges, type Application, type ChangeEvent } from "../api";
 
 const EMPTY: Application[] = [];
 
@@ -33,6 +33,39 @@ export default function ApplicationsPage() {
     load();
   }, []);
 
+  // Apply an {added, updated, removed} delta by pulling only the changed rows.
+  // Our own edits come back as events too, so rows are merged by id.
+  const applyDelta = async (e: ChangeEvent<number>) => {
+    const changed = [...e.added, ...e.updated];
+    const fresh = changed.length ? await api.getApplications(changed) : [];
+    const byId = new Map(fresh.map((a) => [a.id, a]));
+    const removed = new Set(e.removed);
+    setItems((prev) => {
+      const kept = prev.filter((a) => !removed.has(a.id)).map((a) => byId.get(a.id) ?? a);
+      const seen = new Set(kept.map((a) => a.id));
+      return [...fresh.filter((a) => !seen.has(a.id)), ...kept];
+    });
+  };
+
+  // live updates from /events (other tabs, other devices); a "reset" after
+  // the first one means we missed too much while disconnected, so reload once
+  useEffect(() => {
+    let first = true;
+    return subscribeChanges(
+      ["applications"],
+      (e) => {
+        applyDelta(e as ChangeEvent<number>).catch((err) => setError(err?.message || "Failed to apply update."));
+      },
+      () => {
+        if (first) {
+          first = false;
+          return;
+        }
+        load();
+      }
+    );
+  }, []);
+
   const add = async () => {
     try {
       const created = await api.createApplication({
@@ -1,5 +1,5 @@
-import { useEffect, useMemo, useState } from "react";
-import { BASE_URL } from "../api"; // uses your existing api.ts BASE_URL
+import { useEffect, useMemo, useRef, useState } from "react";
+import { api, BASE_URL, subscribeChanges, type ChangeEvent } from "../api"; // uses your existing api.ts BASE_URL
 
 type Job = {
   source?: "lever" | "greenhouse" | string;
@@ -10,6 +10,8 @@ type Job = {
   createdAt?: number | string | null;
   updatedAt?: number | string | null;
   ts?: number; // backend-normalized unix seconds (if present)
+  workplace?: "remote" | "hybrid" | "onsite" | null;
+  remote?: boolean | null;
 };
 
 type Mode = "Any" | "Onsite/Hybrid" | "Remote";
@@ -33,6 +35,17 @@ function toUnixSeconds(v?: number | string | null): number {
   }
 }
 
+function normalize(data: Job[]): Job[] {
+  // make sure we can sort even if backend didn't add ts
+  const normalized = (data || []).map((j) => ({
+    ...j,
+    ts: j.ts ?? toUnixSeconds(j.updatedAt ?? j.createdAt),
+  }));
+  // newest first
+  normalized.sort((a, b) => (b.ts || 0) - (a.ts || 0));
+  return normalized;
+}
+
 function timeAgo(sec: number): string {
   if (!sec) return "";
   const diff = Math.max(0, Math.floor(Date.now() / 1000) - sec);
@@ -55,6 +68,58 @@ export default function JobsPage() {
   const [location, setLocation] = useState("");
   const [mode, setMode] = useState<Mode>("Any");
 
+  // latest list, so change events can merge into it outside of render
+  const jobsRef = useRef<Job[]>([]);
+  const live = useRef(false);
+
+  const setAll = (next: Job[]) => {
+    jobsRef.current = next;
+    setJobs(next);
+    setView(next);
+  };
+
+  const loadAll = async () => {
+    const res = await fetch(`${BASE_URL}/jobs`, {
+      headers: { "Content-Type": "application/json" },
+    });
+    if (!res.ok) throw new Error(`HTTP ${res.status}`);
+    const data: Job[] = await res.json();
+    return normalize(data);
+  };
+
+  // Apply a {added, updated, removed} delta by pulling only the changed jobs.
+  const applyDelta = async (e: ChangeEvent) => {
+    const changed = [...e.added, ...e.updated].map(String);
+    const fresh = changed.length ? await api.lookupJobs<Job>(changed) : [];
+    const drop = new Set([...e.updated, ...e.removed].map(String));
+    const kept = jobsRef.current.filter((j) => !drop.has(j.url || ""));
+    setAll(normalize([...kept, ...fresh]));
+  };
+
+  // live updates from /events; a "reset" after the first one means we missed
+  // too much while disconnected, so reload the whole list once
+  useEffect(() => {
+    let first = true;
+    const unsubscribe = subscribeChanges(
+      ["jobs"],
+      (e) => {
+        applyDelta(e).catch((err) => setError(err?.message || "Failed to apply update."));
+      },
+      () => {
+        live.current = true;
+        if (first) {
+          first = false;
+          return;
+        }
+        loadAll().then(setAll).catch(() => {});
+      }
+    );
+    return () => {
+      live.current = false;
+      unsubscribe();
+    };
+  }, []);
+
   // initial load
   useEffect(() => {
     let mounted = true;
@@ -62,23 +127,9 @@ export default function JobsPage() {
       try {
         setLoading(true);
         setError(null);
-        const res = await fetch(`${BASE_URL}/jobs`, {
-          headers: { "Content-Type": "application/json" },
-        });
-        if (!res.ok) throw new Error(`HTTP ${res.status}`);
-        const data: Job[] = await res.json();
-
-        // make sure we can sort even if backend didn't add ts
-        const normalized = (data || []).map((j) => ({
-          ...j,
-          ts: j.ts ?? toUnixSeconds(j.updatedAt ?? j.createdAt),
-        }));
-
+        const normalized = await loadAll();
         if (mounted) {
-          // newest first
-          normalized.sort((a, b) => (b.ts || 0) - (a.ts || 0));
-          setJobs(normalized);
-          setView(normalized); // show everything by default
+          setAll(normalized); // show everything by default
         }
       } catch (e: any) {
         if (mounted) setError(e?.message || "Failed to load jobs.");
@@ -103,16 +154,8 @@ export default function JobsPage() {
         const t = await res.text().catch(() => "");
         throw new Error(`HTTP ${res.status} on /jobs/refresh – ${t}`);
       }
-      // after refresh, re-list
-      const r2 = await fetch(`${BASE_URL}/jobs`);
-      const data: Job[] = await r2.json();
-      const normalized = (data || []).map((j) => ({
-        ...j,
-        ts: j.ts ?? toUnixSeconds(j.updatedAt ?? j.createdAt),
-      }));
-      normalized.sort((a, b) => (b.ts || 0) - (a.ts || 0));
-      setJobs(normalized);
-      setView(normalized);
+      // the change feed delivers the delta; only re-list if it isn't connected
+      if (!live.current) setAll(await loadAll());
     } catch (e: any) {
       setError(e?.message || "Refresh failed.");
     } finally {
@@ -120,29 +163,40 @@ export default function JobsPage() {
     }
   };
 
-  const filtered = useMemo(() => {
+  // title/company are matched here; location and remote/onsite go to the
+  // backend, which resolves them through its normalized location index
+  const matchesText = useMemo(() => {
     const s = search.trim().toLowerCase();
     const c = company.trim().toLowerCase();
-    const l = location.trim().toLowerCase();
-
-    return jobs.filter((j) => {
+    return (j: Job) => {
       const title = (j.title || "").toLowerCase();
       const comp = (j.company || "").toLowerCase();
-      const loc = (j.location || "").toLowerCase();
-
       const titleMatch =
         !s || title.includes(s) || comp.includes(s); // search matches title or company
       const companyMatch = !c || comp.includes(c);
-      const locationMatch = !l || loc.includes(l);
-
-      // If you ever map "Onsite/Hybrid"/"Remote" explicitly, check here.
-      const modeMatch = mode === "Any" || !mode;
-
-      return titleMatch && companyMatch && locationMatch && modeMatch;
-    });
-  }, [jobs, search, company, location, mode]);
+      return titleMatch && companyMatch;
+    };
+  }, [search, company]);
 
-  const onSearch = () => setView(filtered);
+  const onSearch = async () => {
+    const l = location.trim();
+    if (!l && mode === "Any") {
+      setView(jobs.filter(matchesText));
+      return;
+    }
+    try {
+      setError(null);
+      const params = new URLSearchParams();
+      if (l) params.set("location", l);
+      if (mode !== "Any") params.set("remote", String(mode === "Remote"));
+      const res = await fetch(`${BASE_URL}/jobs?${params.toString()}`);
+      if (!res.ok) throw new Error(`HTTP ${res.status} on /jobs`);
+      const data: Job[] = await res.json();
+      setView(normalize(data).filter(matchesText));
+    } catch (e: any) {
+      setError(e?.message || "Search failed.");
+    }
+  };
   const onClear = () => {
     setSearch("");
     setCompany("");
@@ -228,7 +282,8 @@ export default function JobsPage() {
                           <span className="muted">• {j.company || "Unknown company"}</span>
                         </div>
                         <div className="muted" style={{ marginTop: 4 }}>
-                          {(j.location || "Location n/a")} • {j.source || "source n/a"}
+                          {(j.location || "Location n/a")}
+                          {j.workplace && j.workplace !== "onsite" ? ` (${j.workplace})` : ""} • {j.source || "source n/a"}
                         </div>
                       </div>
                       <div className="muted">{timeAgo(ts)}</div>